@@ -30,6 +30,13 @@ if bpy.context.preferences.filepaths.use_relative_paths == True:
 
 from bseq import *
 from bseq.operators import menu_func_import, add_keymap, delete_keymap
+from bseq import prefetch
+from bseq.cache import clear_caches
+from bseq.scripts import clear_scripts
+from bseq.frames import clear_frame_indices
+from bseq.watcher import clear_watch_states
+from bseq.tail import register_tail, unregister_tail
+from additional_file_formats import obj as obj_format
 
 classes = [
     BSEQ_obj_property,
@@ -66,7 +73,9 @@ classes = [
     # BSEQ_OT_delete_zips,
     # BSEQ_addon_preferences,
     BSEQ_OT_load_all,
-    BSEQ_OT_load_all_recursive
+    BSEQ_OT_load_all_recursive,
+    BSEQ_OT_clear_cache,
+    BSEQ_OT_bake,
 ]
 
 def register():
@@ -84,6 +93,7 @@ def register():
     # so when addon being installed, it can run correctly
     # because scene is not used, so pass None into it
     BSEQ_initialize(None)
+    register_tail()
 
 def unregister():
     for cls in classes:
@@ -95,6 +105,13 @@ def unregister():
     bpy.types.TOPBAR_MT_file_import.remove(menu_func_import)
     delete_keymap()
     unsubscribe_to_selected()
+    prefetch.shutdown()
+    obj_format.shutdown()
+    clear_caches()
+    clear_scripts()
+    clear_frame_indices()
+    clear_watch_states()
+    unregister_tail()
 
 if __name__ == "__main__":
     # unregister()
@@ -1,3 +1,37 @@
+import os
+import meshio
+
+# extension -> function(filepath) that returns the arrays of the Blender mesh of a file directly, without
+# building a meshio.Mesh first. The arrays are named like the ones of a baked frame (see bseq/bake.py):
+# co, edges, loops, loop_start, loop_total, point:<name> and field:<name>
+array_readers = {}
+
+# extension -> function(filepath) that reads a file like meshio.read, but parses large files in several processes
+parallel_readers = {}
+
+
+def get_array_reader(filepath):
+    '''
+    Returns the array reader of the format of filepath, or None if there is none
+    '''
+    return array_readers.get(os.path.splitext(filepath)[1].lower())
+
+
+def read(filepath, parallel=False):
+    '''
+    Reads filepath with the array reader of its format if there is one, otherwise returns a meshio.Mesh.
+    If parallel, formats with a parallel reader are parsed in several processes.
+    '''
+    reader = get_array_reader(filepath)
+    if reader is not None:
+        return reader(filepath)
+    if parallel:
+        reader = parallel_readers.get(os.path.splitext(filepath)[1].lower())
+        if reader is not None:
+            return reader(filepath)
+    return meshio.read(filepath)
+
+
 from . import bgeo
 from . import mzd
-from . import obj
\ No newline at end of file
+from . import obj
@@ -1,110 +1,360 @@
 import gzip
 import numpy as np
 import meshio
+from . import array_readers
 
 
-def readbgeo_to_meshio(filepath):
+# bytes inflated at once, which bounds the memory needed on top of the point data
+chunk_size = 1 << 20
+
+# numbers of elements and attributes after b"BgeoV" and the version
+header_dtype = np.dtype([('nPoints', '>i4'), ('nPrims', '>i4'), ('nPointGroups', '>i4'), ('nPrimGroups', '>i4'),
+                         ('nPointAttrib', '>i4'), ('nVertexAttrib', '>i4'), ('nPrimAttrib', '>i4'),
+                         ('nAttrib', '>i4')])
+
+# houdini attribute type -> name
+attribute_types = {0: 'FLOAT', 1: 'INT', 4: 'INDEX', 5: 'VECTOR'}
+
+# primitive type ids
+prim_poly = 0x00000001
+prim_particle = 0x00008000
+
+
+def read_int(file, length=4):
+    return int.from_bytes(file.read(length), byteorder="big")
+
+
+def read_attribute_definitions(file, count):
+    '''
+    Returns a list of (name, size, type) of count attribute definitions, the default values are skipped
+    '''
+    definitions = []
+    for _ in range(count):
+        namelength = read_int(file, 2)
+        name = file.read(namelength).decode('utf-8')
+        size = read_int(file, 2)
+        houdni_type = read_int(file)
+        if houdni_type not in attribute_types:
+            raise Exception('houdni_type unknown/ unsupported')
+        if attribute_types[houdni_type] == 'INDEX':
+            # the values are indices into a table of strings, which is not imported
+            for _ in range(read_int(file)):
+                file.read(read_int(file, 2))
+        else:
+            # read default value
+            # not going to do anything about it
+            file.read(size * 4)
+        definitions.append((name, size, attribute_types[houdni_type]))
+    return definitions
+
+
+def get_attributes(data, definitions, start=0):
+    '''
+    Splits the native float32 columns (last axis) of data into the attributes of definitions, as views of data
+    '''
+    attributes = {}
+    for name, size, houdni_type in definitions:
+        columns = data[..., start:start + size]
+        if size == 1:
+            columns = columns[..., 0]
+        if houdni_type in ('INT', 'INDEX'):
+            # the bits have been read as float32, they are int32 values
+            columns = columns.view(np.int32)
+        attributes[name] = columns
+        start += size
+    return attributes
+
+
+def read_point_block(file, num_points, particle_size):
+    '''
+    Inflates the big endian point block of the gzip stream file chunk by chunk into a preallocated
+    num_points x particle_size native float32 array, the bytes of every chunk are swapped in place
+    '''
+    attribute_data = np.empty((num_points, particle_size), dtype=np.float32)
+    buffer = memoryview(attribute_data.reshape(-1).view(np.uint8))
+    words = attribute_data.reshape(-1).view(np.uint32)
+    filled = 0
+    swapped = 0
+    while filled < len(buffer):
+        n = file.readinto(buffer[filled:filled + chunk_size])
+        if n == 0:
+            raise Exception("file didn't end")
+        filled += n
+        # chunks may end in the middle of a value
+        end = filled // 4
+        words[swapped:end].byteswap(inplace=True)
+        swapped = end
+    return attribute_data
+
+
+def to_native(values):
+    '''
+    Returns big endian float32 values as native float32 with the same bits, which may also be int32 values
+    '''
+    return values.view('>u4').astype(np.uint32).view(np.float32)
+
+
+def get_poly_dtype(n, index_dtype, vertex_size, prim_size):
+    '''
+    Record of a polygon with n vertices: type, number of vertices, closed flag, the point index and
+    vertex attributes of every vertex, then the primitive attributes
+    '''
+    return np.dtype([('type', '>u4'), ('n', '>i4'), ('closed', 'u1'),
+                     ('vertices', [('index', index_dtype), ('attributes', '>f4', (vertex_size,))], (n,)),
+                     ('attributes', '>f4', (prim_size,))])
+
+
+class ChunkStream:
+    '''
+    Reads the rest of the gzip stream file on demand, one chunk of chunk_size inflated bytes at a time.
+    Only the bytes that have not been consumed yet are kept.
+    '''
+
+    def __init__(self, file):
+        self.file = file
+        self.buffer = np.empty(chunk_size, dtype=np.uint8)
+        # the bytes [start, end) of buffer have been read but not consumed
+        self.start = 0
+        self.end = 0
+        self.eof = False
+
+    def fill(self, size):
+        '''
+        Makes at least size unconsumed bytes available, unless the stream ends before. Returns the number of
+        unconsumed bytes, which start at self.start in self.buffer
+        '''
+        while self.end - self.start < size and not self.eof:
+            n = self.end - self.start
+            if self.start + size > len(self.buffer) or self.end == len(self.buffer):
+                # move the unconsumed bytes to the front, records larger than a chunk need a larger buffer
+                buffer = self.buffer if size <= len(self.buffer) else np.empty(size, dtype=np.uint8)
+                buffer[:n] = self.buffer[self.start:self.end]
+                self.buffer = buffer
+                self.start = 0
+                self.end = n
+            read = self.file.readinto(memoryview(self.buffer)[self.end:])
+            if read == 0:
+                self.eof = True
+            self.end += read
+        return self.end - self.start
+
+    def read(self, dtype, count):
+        '''
+        Returns the next count values of dtype as a view of the buffer, which is only valid until the next fill
+        '''
+        dtype = np.dtype(dtype)
+        if self.fill(count * dtype.itemsize) < count * dtype.itemsize:
+            raise Exception("file didn't end")
+        values = np.frombuffer(self.buffer, dtype, count, self.start)
+        self.start += count * dtype.itemsize
+        return values
+
+    def peek(self, dtype, offset=0):
+        '''
+        Returns the value of dtype at offset of the unconsumed bytes without consuming it
+        '''
+        dtype = np.dtype(dtype)
+        if self.fill(offset + dtype.itemsize) < offset + dtype.itemsize:
+            raise Exception("file didn't end")
+        return np.frombuffer(self.buffer, dtype, 1, self.start + offset)[0]
+
+
+def get_polygon_fields(records):
+    '''
+    Copies the fields of polygon records out of the stream buffer: (number of vertices, closed flags, point indices,
+    native vertex attributes, native primitive attributes)
+    '''
+    vertices = records['vertices']
+    # numpy converts structured arrays to native byte order when they are concatenated, so the fields
+    # are converted one by one
+    return (vertices.shape[1], records['closed'] != 0, vertices['index'].astype(np.int32),
+            to_native(vertices['attributes']), to_native(records['attributes']))
+
+
+def read_primitives(stream, num_prims, num_points, vertex_size, prim_size):
+    '''
+    Parses the primitives of the ChunkStream stream. Consecutive polygons with the same number of vertices are
+    read at once as structured records, up to a chunk at a time. Returns (polygon blocks, particle point indices),
+    where every polygon block is the result of get_polygon_fields for its records.
+    '''
+    # point indices are shorts if they fit
+    index_dtype = np.dtype('>u2' if num_points < 1 << 16 else '>u4')
+    polygons = []
+    particles = []
+    i = 0
+    while i < num_prims:
+        prim_type = int(stream.peek('>u4'))
+        if prim_type == prim_particle:
+            n = int(stream.peek('>i4', 4))
+            stream.read(np.uint8, 8)
+            particles.append(stream.read(index_dtype, n).astype(np.int32))
+            i += 1
+        elif prim_type == prim_poly:
+            n = int(stream.peek('>i4', 4))
+            dtype = get_poly_dtype(n, index_dtype, vertex_size, prim_size)
+            # read a growing number of records, until one of them is not a polygon with n vertices
+            window = 64
+            start = i
+            while i < num_prims:
+                count = min(window, num_prims - i, max(chunk_size // dtype.itemsize, 1))
+                count = min(count, stream.fill(count * dtype.itemsize) // dtype.itemsize)
+                if count == 0:
+                    if i == start:
+                        raise Exception("file didn't end")
+                    # the next primitive is smaller than a polygon with n vertices
+                    break
+                records = np.frombuffer(stream.buffer, dtype, count, stream.start)
+                same = (records['type'] == prim_poly) & (records['n'] == n)
+                k = count if same.all() else int(np.argmin(same))
+                if k > 0:
+                    polygons.append(get_polygon_fields(records[:k]))
+                stream.start += k * dtype.itemsize
+                i += k
+                if k < count:
+                    break
+                window *= 2
+        else:
+            raise Exception('bgeo primitive type {:#x} unsupported'.format(prim_type))
+    return polygons, particles
+
+
+def get_polygon_blocks(polygons, vertex_attributes, prim_attributes):
+    '''
+    Groups the closed polygons by their number of vertices. Returns a list of (n, n_faces x n block of point
+    indices, vertex attributes, primitive attributes), sorted by n, and the edges of the open polygons.
+    '''
+    closed = {}
+    edges = []
+    for n, is_closed, indices, vertex_values, prim_values in polygons:
+        if not is_closed.all():
+            # open polygons are polylines
+            open_indices = indices[~is_closed]
+            edges.append(np.stack((open_indices[:, :-1], open_indices[:, 1:]), axis=-1).reshape(-1, 2))
+            indices = indices[is_closed]
+            vertex_values = vertex_values[is_closed]
+            prim_values = prim_values[is_closed]
+        if n >= 3 and len(indices) > 0:
+            closed.setdefault(n, []).append((indices, vertex_values, prim_values))
+
+    blocks = []
+    for n in sorted(closed):
+        indices, vertex_values, prim_values = [np.concatenate(values) for values in zip(*closed[n])]
+        blocks.append((n, indices, get_attributes(vertex_values, vertex_attributes),
+                       get_attributes(prim_values, prim_attributes)))
+    edges = np.concatenate(edges) if edges else np.empty((0, 2), dtype=np.int32)
+    return blocks, edges
+
+
+def get_bgeo_field_data(blocks):
+    '''
+    Vertex and primitive attributes in the order of the loops and faces of blocks, as field data
+    "corner:<name>" and "face:<name>"
+    '''
+    field_data = {}
+    if not blocks:
+        return field_data
+    for name in blocks[0][2]:
+        values = [vertex_values[name] for _, _, vertex_values, _ in blocks]
+        # vertex normals N are used as split normals, like the face corner normals of other formats
+        field_data['corner:' + ('normal' if name == 'N' else name)] = np.concatenate(
+            [v.reshape((-1, ) + v.shape[2:]) for v in values])
+    for name in blocks[0][3]:
+        field_data['face:' + name] = np.concatenate([prim_values[name] for _, _, _, prim_values in blocks])
+    return field_data
+
+
+def read_bgeo(filepath):
+    '''
+    Returns (positions, point attributes, polygon blocks, edges, particle point indices) of a bgeo file.
+    Positions and point attributes are strided native endian views of one num_points x particle_size array,
+    see get_polygon_blocks for the polygon blocks and edges.
+    '''
     with gzip.open(filepath, 'r') as file:
         byte = file.read(5)
         if byte != b"BgeoV":
             raise Exception('not bgeo file format')
-        byte = file.read(4)
-        version = int.from_bytes(byte, byteorder="big")
+        version = read_int(file)
         if version != 5:
             raise Exception('bgeo file not version 5')
 
-        header = {}
-        point_attributes = {}
-        point_attributes_names = []
-        point_attributes_sizes = []
-        point_attributes_types = []
-        position = None
-
-        byte = file.read(4)
-        header['nPoints'] = int.from_bytes(byte, byteorder="big")
-
-        byte = file.read(4)
-        header['nPrims'] = int.from_bytes(byte, byteorder="big")
-
-        byte = file.read(4)
-        header['nPointGroups'] = int.from_bytes(byte, byteorder="big")
-
-        byte = file.read(4)
-        header['nPrimGroups'] = int.from_bytes(byte, byteorder="big")
-
-        byte = file.read(4)
-        header['nPointAttrib'] = int.from_bytes(byte, byteorder="big")
-
-        byte = file.read(4)
-        header['nVertexAttrib'] = int.from_bytes(byte, byteorder="big")
-
-        byte = file.read(4)
-        header['nPrimAttrib'] = int.from_bytes(byte, byteorder="big")
-
-        byte = file.read(4)
-        header['nAttrib'] = int.from_bytes(byte, byteorder="big")
-
-        particle_size = 4
-
-        for _ in range(header['nPointAttrib']):
-            byte = file.read(2)
-            namelength = int.from_bytes(byte, byteorder="big")
-            name_binary = file.read(namelength)
-            name = name_binary.decode('utf-8')
-            point_attributes_names.append(name)
-
-            byte = file.read(2)
-            size = int.from_bytes(byte, byteorder="big")
-            point_attributes_sizes.append(size)
-            particle_size += size
-
-            byte = file.read(4)
-            houdni_type = int.from_bytes(byte, byteorder="big")
-            if houdni_type == 0:
-                point_attributes_types.append('FLOAT')
-                # read default value
-                # not going to do anything about it
-                byte = file.read(size * 4)
-            elif houdni_type == 1:
-                point_attributes_types.append('INT')
-                # read default value
-                # not going to do anything about it
-                byte = file.read(size * 4)
-            elif houdni_type == 5:
-                point_attributes_types.append('VECTOR')
-                # read default value
-                # not going to do anything about it
-                byte = file.read(size * 4)
-            else:
-                raise Exception('houdni_type unknown/ unsupported')
-        byte = file.read(particle_size * header['nPoints'] * 4)
-        # > means big endian
-        attribute_data = np.frombuffer(byte, dtype='>f')
-        attribute_data = np.reshape(attribute_data, (header['nPoints'], particle_size))
+        header = np.frombuffer(file.read(header_dtype.itemsize), dtype=header_dtype)[0]
+        header = {name: int(header[name]) for name in header_dtype.names}
+
+        point_attributes = read_attribute_definitions(file, header['nPointAttrib'])
+        # position with homogeneous coordinate, then the attributes
+        particle_size = 4 + sum(size for _, size, _ in point_attributes)
+        attribute_data = read_point_block(file, header['nPoints'], particle_size)
         # the first 3 column is its position data
         position = attribute_data[:, :3]
         # the 4th column is homogeneous coordiante, which is all 1, and will be ignored
+        # the attributes are views of the columns of attribute_data, nothing is copied
+        point_data = get_attributes(attribute_data, point_attributes, 4)
 
-        current_attribute_start_point = 4
-        for i in range(header['nPointAttrib']):
-            if point_attributes_types[i] == 'FLOAT':
-                point_attributes[point_attributes_names[i]] = attribute_data[:, current_attribute_start_point]
-                current_attribute_start_point += 1
-            elif point_attributes_types[i] == 'VECTOR':
-                point_attributes[
-                    point_attributes_names[i]] = attribute_data[:,
-                                                                current_attribute_start_point:current_attribute_start_point + 3]
-                current_attribute_start_point += 3
-            elif point_attributes_types[i] == 'INT':
-                data = (attribute_data[:, current_attribute_start_point]).tobytes()
-                # > means big endian
-                point_attributes[point_attributes_names[i]] = np.frombuffer(data, dtype='>i')
-                current_attribute_start_point += 1
-        remaining = file.read()
-        if not remaining == b'\x00\xff':
-            raise Exception("file didn't end")
-        return meshio.Mesh(position, [('vertex', [])], point_data=point_attributes)
+        vertex_attributes = read_attribute_definitions(file, header['nVertexAttrib'])
+        prim_attributes = read_attribute_definitions(file, header['nPrimAttrib'])
+
+        # the primitives are inflated chunk by chunk as well
+        stream = ChunkStream(file)
+        polygons, particles = read_primitives(stream, header['nPrims'], header['nPoints'],
+                                              sum(size for _, size, _ in vertex_attributes),
+                                              sum(size for _, size, _ in prim_attributes))
+
+        # groups and detail attributes follow the primitives, they are not imported
+        if header['nPointGroups'] == 0 and header['nPrimGroups'] == 0 and header['nAttrib'] == 0:
+            if stream.fill(3) != 2 or bytes(stream.read(np.uint8, 2)) != b'\x00\xff':
+                raise Exception("file didn't end")
+
+    blocks, edges = get_polygon_blocks(polygons, vertex_attributes, prim_attributes)
+    particles = np.concatenate(particles) if particles else np.empty(0, dtype=np.int32)
+    return position, point_data, blocks, edges, particles
+
+
+def readbgeo_to_meshio(filepath):
+    position, point_data, blocks, edges, particles = read_bgeo(filepath)
+    cells = []
+    for n, indices, _, _ in blocks:
+        if n == 3:
+            cells.append(meshio.CellBlock('triangle', indices))
+        elif n == 4:
+            cells.append(meshio.CellBlock('quad', indices))
+        else:
+            cells.append(meshio.CellBlock('polygon', indices))
+    if len(edges) > 0:
+        cells.append(meshio.CellBlock('line', edges))
+    if not cells:
+        cells.append(('vertex', particles[:, None] if len(particles) > 0 else []))
+    return meshio.Mesh(position, cells, point_data=point_data, field_data=get_bgeo_field_data(blocks))
+
+
+def readbgeo_to_arrays(filepath):
+    '''
+    Returns the arrays of the Blender mesh of a bgeo file, the same mesh as the one of readbgeo_to_meshio
+    '''
+    position, point_data, blocks, edges, _ = read_bgeo(filepath)
+    n_poly = sum(len(indices) for _, indices, _, _ in blocks)
+    if blocks:
+        loops = np.concatenate([indices.ravel() for _, indices, _, _ in blocks])
+        loop_total = np.concatenate([np.full(len(indices), n, dtype=np.int32) for n, indices, _, _ in blocks])
+    else:
+        loops = np.empty(0, dtype=np.int32)
+        loop_total = np.empty(0, dtype=np.int32)
+    loop_start = np.zeros(n_poly, dtype=np.int32)
+    np.cumsum(loop_total[:-1], dtype=np.int32, out=loop_start[1:])
+
+    arrays = {
+        "co": position,
+        "edges": edges.ravel(),
+        "loops": loops,
+        "loop_start": loop_start,
+        "loop_total": loop_total,
+    }
+    for k, v in point_data.items():
+        arrays["point:" + k] = v
+    for k, v in get_bgeo_field_data(blocks).items():
+        arrays["field:" + k] = v
+    return arrays
 
 
 # no need for write function
 meshio.register_format("bgeo", [".bgeo"], readbgeo_to_meshio, {".bgeo": None})
+array_readers[".bgeo"] = readbgeo_to_arrays
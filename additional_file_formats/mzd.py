@@ -1,317 +1,269 @@
-## TODO: use dictionary as cells is going to be deprecated, should use list instead
-
-head = b"    MZD-File-Format    \x00"  # c string has \x00 as end
-end = b"   >> END OF FILE <<   \x00"  # c string has \x00 as end
-import bpy
+import mmap
 import numpy as np
 import meshio
-from .table import table
-
-num_nodes_to_name = {3: 'triangle', 4: 'quad'}
+from . import array_readers
+from .surface import unique_faces
 
+head = b"    MZD-File-Format    \x00"  # c string has \x00 as end
+end = b"   >> END OF FILE <<   \x00"  # c string has \x00 as end
 
-def readMZD_to_meshio(filepath):
-    out_numVertices = None
-    out_numPolygons = None
-    out_vertPositions = None
-    out_numNodes = None  # number of loops
-    out_polyVIndicesNum = None  # faces_loop_total
-    out_polyVIndices = None  #loops_vert_idx
-    cells = {}
+# chunk id -> name of the chunk
+chunk_names = {
+    0x0ABC0001: "vertices",  # vertices and polygons
+    0xDA7A0001: "normals",  # vertex normals
+    0xDA7A0002: "motions",  # vertex motions
+    0xDA7A0003: "colors",  # vertex colors
+    0xDA7A0004: "uvws",  # vertex UVWs
+    0xDA7A0011: "node_normals",  # face corner normals
+    0xDA7A0013: "node_colors",  # face corner colors
+    0xDA7A0014: "node_uvws",  # face corner UVWs
+}
+
+# every chunk starts with id (uint32), name (24 bytes) and size of the data (uint32)
+chunk_header = np.dtype([("id", "<u4"), ("name", "S24"), ("size", "<u4")])
+
+
+def read_chunk_index(buffer):
+    '''
+    Scans the chunk headers once, returns chunk name -> (offset, size) of the data of the chunk
+    '''
+    if bytes(buffer[:len(head)]) != head:
+        raise Exception('not mzd file format')
+    index = {}
+    pos = len(head)
+    while pos + chunk_header.itemsize <= len(buffer):
+        if bytes(buffer[pos:pos + len(end)]) == end:
+            break
+        header = np.frombuffer(buffer, dtype=chunk_header, count=1, offset=pos)[0]
+        pos += chunk_header.itemsize
+        name = chunk_names.get(int(header["id"]))
+        # if a chunk appears more than once, the first one is used
+        if name is not None and name not in index:
+            index[name] = (pos, int(header["size"]))
+        pos += int(header["size"])
+    return index
+
+
+def read_uint32(buffer, offset):
+    return int(np.frombuffer(buffer, dtype="<u4", count=1, offset=offset)[0])
+
+
+def read_vertices_chunk(buffer, offset):
+    '''
+    Returns (positions, loop totals, loop vertex indices) as views of buffer
+    '''
+    num_vertices = read_uint32(buffer, offset)
+    offset += 4
+    positions = np.frombuffer(buffer, dtype="<f4", count=3 * num_vertices, offset=offset).reshape((num_vertices, 3))
+    offset += 12 * num_vertices
+    if num_vertices == 0:
+        return positions, np.empty(0, dtype=np.uint8), np.empty(0, dtype=np.int32)
+
+    num_polygons = read_uint32(buffer, offset)
+    offset += 4
+    loop_total = np.frombuffer(buffer, dtype=np.uint8, count=num_polygons, offset=offset)
+    offset += num_polygons
+    num_nodes = int(loop_total.sum(dtype=np.int64))
+
+    bytes_per_index = read_uint32(buffer, offset)
+    offset += 4
+    if bytes_per_index == 4:
+        loops = np.frombuffer(buffer, dtype="<i4", count=num_nodes, offset=offset)
+    elif bytes_per_index == 2:
+        # WARNING: not sure if it's correct
+        # uncovered branch from test data
+        loops = np.frombuffer(buffer, dtype="<u2", count=num_nodes, offset=offset)
+    else:
+        raise Exception('unsupported index size in mzd file: {}'.format(bytes_per_index))
+    return positions, loop_total, loops
+
+
+def read_attribute_chunk(buffer, offset, dtype, width, expected_count):
+    '''
+    Returns the count x width array of an attribute chunk as a view of buffer
+    '''
+    count = read_uint32(buffer, offset)
+    if count != expected_count:
+        raise Exception('mzd attribute has {} values, expected {}'.format(count, expected_count))
+    return np.frombuffer(buffer, dtype=dtype, count=count * width, offset=offset + 4).reshape((count, width))
+
+
+# chunk name -> (dtype, values per vertex or face corner)
+attribute_layouts = {
+    "normals": ("<u2", 3),
+    "motions": ("<u2", 3),
+    "colors": ("<u2", 4),
+    "uvws": ("<f4", 3),
+    "node_normals": ("<u2", 3),
+    "node_colors": ("<u2", 4),
+    "node_uvws": ("<f4", 3),
+}
+
+
+def read_mzd_chunks(filepath, chunks=None):
+    '''
+    Memory maps an mzd file and returns chunk name -> zero-copy views of its data. The vertices chunk is
+    returned as (positions, loop totals, loop vertex indices), attribute chunks as one array with the raw
+    values (half floats as uint16). If chunks is given, only these chunks are read. The views hold the file open,
+    so anything that outlives the reader has to be copied (see get_mzd_attributes and get_positions).
+    '''
+    with open(filepath, 'rb') as file:
+        # the views keep the memory map alive after the file is closed
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    index = read_chunk_index(buffer)
+    if "vertices" not in index:
+        raise Exception('mzd file has no vertices')
+
+    result = {}
+    vertices = read_vertices_chunk(buffer, index["vertices"][0])
+    if chunks is None or "vertices" in chunks:
+        result["vertices"] = vertices
+    num_vertices = len(vertices[0])
+    num_nodes = len(vertices[2])
+    for name, (dtype, width) in attribute_layouts.items():
+        if name not in index or (chunks is not None and name not in chunks):
+            continue
+        expected_count = num_nodes if name.startswith("node_") else num_vertices
+        result[name] = read_attribute_chunk(buffer, index[name][0], dtype, width, expected_count)
+    return result
+
+
+def decode_half(bits):
+    '''
+    Decodes raw half floats (uint16) into float32
+    '''
+    values = bits.view(np.float16).astype(np.float32)
+    nan = np.isnan(values)
+    if nan.any():
+        # numpy keeps signaling NaNs signaling, make them quiet NaNs
+        values.view(np.uint32)[nan] |= 0x00400000
+    return values
+
+
+def get_polygon_blocks(loop_total, loops):
+    '''
+    Splits the polygons into one n_faces x n_vertices block per number of vertices, without duplicated faces.
+    Returns a list of (number of vertices, face corner indices, block) in the order of the final cells,
+    where the face corner indices are the positions of the loops of the block in the file.
+    '''
+    loop_start = np.zeros(len(loop_total), dtype=np.int64)
+    np.cumsum(loop_total[:-1], dtype=np.int64, out=loop_start[1:])
+    blocks = []
+    for n in np.unique(loop_total):
+        if n < 3:
+            continue
+        polygons = np.flatnonzero(loop_total == n)
+        corners = loop_start[polygons][:, None] + np.arange(n)
+        block = loops[corners]
+        # remove duplicated faces
+        keep = unique_faces(block)
+        blocks.append((int(n), corners[keep], block[keep]))
+    return blocks
+
+
+def get_corner_indices(blocks):
+    '''
+    Returns the positions in the file of all loops of the polygon blocks, in the order of the final loops
+    '''
+    if not blocks:
+        return np.empty(0, dtype=np.int64)
+    return np.concatenate([corners.ravel() for _, corners, _ in blocks])
+
+
+def get_mzd_attributes(chunks, blocks):
+    '''
+    Returns (point_data, field_data) of the attribute chunks, face corner attributes are stored as
+    field data "corner:<name>" in the order of the loops of the polygon blocks
+    '''
     point_data = {}
+    if "normals" in chunks:
+        point_data['normal'] = decode_half(chunks["normals"])
+    if "motions" in chunks:
+        point_data['velocity'] = decode_half(chunks["motions"])
+    if "colors" in chunks:
+        point_data['color'] = decode_half(chunks["colors"])
+    if "uvws" in chunks:
+        point_data['uvw_map'] = chunks["uvws"].copy()
+
+    field_data = {}
+    if any(name in chunks for name in ("node_normals", "node_colors", "node_uvws")):
+        corners = get_corner_indices(blocks)
+        if "node_normals" in chunks:
+            field_data['corner:normal'] = decode_half(chunks["node_normals"][corners])
+        if "node_colors" in chunks:
+            field_data['corner:color'] = decode_half(chunks["node_colors"][corners])
+        if "node_uvws" in chunks:
+            field_data['corner:uvw'] = chunks["node_uvws"][corners]
+    return point_data, field_data
+
+
+def get_positions(chunks):
+    '''
+    Copy of the vertex positions, the returned meshes end up in the frame cache and must not keep the file mapped
+    '''
+    return chunks["vertices"][0].copy()
 
-    with open(filepath, 'rb') as file:
-        byte = file.read(24)
-        # check if mzd file is empty
-        if byte != head:
-            return -4
-        while 1:
-            # check if it reach the end
-            byte = file.read(24)
-            if byte == end:
-                break
-            else:
-                # if not reach the end, rewind the pointer back 24 bytes
-                file.seek(-24, 1)
-
-            byte = file.read(4)
-            chunkID = int.from_bytes(byte, byteorder='little')
-
-            byte = file.read(24)
-            name = byte
-
-            byte = file.read(4)
-            size = int.from_bytes(byte, byteorder='little')
-
-            if chunkID == 0x0ABC0001:  # vertices and polygons.
-
-                byte = file.read(4)
-                out_numVertices = int.from_bytes(byte, byteorder='little')
-                if out_numVertices < 0:
-                    return -127
-                if out_numVertices == 0:
-                    return meshio.Mesh(points=np.array([]), cells={})
-
-                byte = file.read(12 * out_numVertices)
-                out_vertPositions = np.frombuffer(byte, dtype=np.float32)
-
-                byte = file.read(4)
-                out_numPolygons = int.from_bytes(byte, byteorder='little')
-
-                byte = file.read(out_numPolygons)
-                out_polyVIndicesNum = np.frombuffer(byte, dtype=np.uint8)
-                out_numNodes = out_polyVIndicesNum.sum(dtype=np.int32)
-
-                byte = file.read(4)
-                numBytesPerPolyVInd = int.from_bytes(byte, byteorder='little')
-
-                if numBytesPerPolyVInd == 4:
-                    #  int
-                    byte = file.read(out_numNodes * numBytesPerPolyVInd)
-                    out_polyVIndices = np.frombuffer(byte, dtype=np.int32)
-                elif numBytesPerPolyVInd == 2:
-                    #  unsigned short
-                    byte = file.read(out_numNodes * numBytesPerPolyVInd)
-                    # WARNING: not sure if it's correct
-                    # uncovered branch from test data
-                    out_polyVIndices = np.frombuffer(byte, dtype=np.uint16)
-                else:
-                    return -127
-                start_polyVIndicesNum = 0
-                start_polyVIndices = 0
-                breaks = np.where(out_polyVIndicesNum[:-1] != out_polyVIndicesNum[1:])[0] + 1
-                breaks = np.append(breaks, len(out_polyVIndicesNum))
-                for b in breaks:
-                    poly_nodes_num = out_polyVIndicesNum[start_polyVIndicesNum]  # 3(triangle) or 4 (quad)
-                    end_polyVIndices = start_polyVIndices + poly_nodes_num * (b - start_polyVIndicesNum)
-                    cells[num_nodes_to_name[poly_nodes_num]] = out_polyVIndices[start_polyVIndices:end_polyVIndices].reshape(
-                        ((b - start_polyVIndicesNum), poly_nodes_num))
-                    start_polyVIndices = end_polyVIndices
-                    start_polyVIndicesNum = b
-
-                faces_copy = np.copy(cells['triangle'])
-                faces_copy.sort(axis=1)
-                _, indxs, count = np.unique(faces_copy, axis=0, return_index=True, return_counts=True)
-                faces = cells['triangle'][indxs]
-                cells['triangle'] = faces
-
-                faces_copy = np.copy(cells['quad'])
-                faces_copy.sort(axis=1)
-                _, indxs, count = np.unique(faces_copy, axis=0, return_index=True, return_counts=True)
-                faces = cells['quad'][indxs]
-                cells['quad'] = faces
-
-            elif chunkID == 0xDA7A0001:  # vertex normals.
-                byte = file.read(4)
-                out_numVerticeAttributes = int.from_bytes(byte, byteorder='little')
-                if out_numVerticeAttributes != out_numVertices:
-                    return -127
-
-                byte = file.read(out_numVerticeAttributes * 6)
-                out_vertAttribute = np.frombuffer(byte, dtype=np.uint16)
-                out_vertAttribute = table[out_vertAttribute]
-                point_data['normal'] = out_vertAttribute.reshape((out_numVerticeAttributes, 3))
-
-            elif chunkID == 0xDA7A0002:  # vertex motions
-                byte = file.read(4)
-                out_numVerticeAttributes = int.from_bytes(byte, byteorder='little')
-                if out_numVerticeAttributes != out_numVertices:
-                    return -127
-
-                byte = file.read(out_numVerticeAttributes * 6)
-                out_vertAttribute = np.frombuffer(byte, dtype=np.uint16)
-                out_vertAttribute = table[out_vertAttribute]
-                point_data['velocity'] = out_vertAttribute.reshape((out_numVerticeAttributes, 3))
-
-            elif chunkID == 0xDA7A0003:  # vertex colors
-                byte = file.read(4)
-                out_numVerticeAttributes = int.from_bytes(byte, byteorder='little')
-                if out_numVerticeAttributes != out_numVertices:
-                    return -127
-
-                byte = file.read(out_numVerticeAttributes * 8)
-                out_vertAttribute = np.frombuffer(byte, dtype=np.uint16)
-                out_vertAttribute = table[out_vertAttribute]
-                point_data['color'] = out_vertAttribute.reshape((out_numVerticeAttributes, 3))
-
-            elif chunkID == 0xDA7A0004:  # vertex UVWs.
-                byte = file.read(4)
-                out_numVerticeAttributes = int.from_bytes(byte, byteorder='little')
-                if out_numVerticeAttributes != out_numVertices:
-                    return -127
-
-                byte = file.read(out_numVerticeAttributes * 12)
-                out_vertAttribute = np.frombuffer(byte, dtype=np.float32)
-                point_data['uvw_map'] = out_vertAttribute.reshape((out_numVerticeAttributes, 3))
-
-            # For the rest of attributes, because meshio doest not support attributes on nodes, (equivalent to face cornder in blender)
-            # So the attributes data will be skipped
-            elif chunkID == 0xDA7A0011:  # node normals.
-                file.seek(size, 1)
-                pass
-            elif chunkID == 0xDA7A0013:  # node colors.
-                file.seek(size, 1)
-                pass
-            elif chunkID == 0xDA7A0014:  # node UVWs.
-                file.seek(size, 1)
-                pass
-            else:
-                file.seek(size, 1)
-                pass
-    return meshio.Mesh(out_vertPositions.reshape((out_numVertices, 3)), cells, point_data)
-
-
-def readMZD_to_bpymesh(filepath, mesh):
-    shade_scheme = False
-    if mesh.polygons:
-        shade_scheme = mesh.polygons[0].use_smooth
-
-    if len(mesh.vertices) > 0:
-        mesh.clear_geometry()
-
-    out_numVertices = None
-    out_numPolygons = None
-    out_vertPositions = None
-    out_numNodes = None  # number of loops
-    out_polyVIndicesNum = None  # faces_loop_total
-    out_polyVIndices = None  #loops_vert_idx
 
-    with open(filepath, 'rb') as file:
-        byte = file.read(24)
-        if byte != head:
-            return -4
-        while 1:
-            # check if it reach the end
-            byte = file.read(24)
-            if byte == end:
-                break
-            else:
-                # if not reach the end, rewind the pointer back 24 bytes
-                file.seek(-24, 1)
-
-            byte = file.read(4)
-            chunkID = int.from_bytes(byte, byteorder='little')
-
-            byte = file.read(24)
-            name = byte
-
-            byte = file.read(4)
-            size = int.from_bytes(byte, byteorder='little')
-
-            if chunkID == 0x0ABC0001:  # vertices and polygons.
-
-                byte = file.read(4)
-                out_numVertices = int.from_bytes(byte, byteorder='little')
-                if out_numVertices < 0:
-                    return -127
-                if out_numVertices == 0:
-                    break
-
-                byte = file.read(12 * out_numVertices)
-                out_vertPositions = np.frombuffer(byte, dtype=np.float32)
-
-                byte = file.read(4)
-                out_numPolygons = int.from_bytes(byte, byteorder='little')
-
-                byte = file.read(out_numPolygons)
-                out_polyVIndicesNum = np.frombuffer(byte, dtype=np.uint8)
-                out_numNodes = out_polyVIndicesNum.sum(dtype=np.int32)
-
-                byte = file.read(4)
-                numBytesPerPolyVInd = int.from_bytes(byte, byteorder='little')
-
-                if numBytesPerPolyVInd == 4:
-                    #  int
-                    byte = file.read(out_numNodes * numBytesPerPolyVInd)
-                    out_polyVIndices = np.frombuffer(byte, dtype=np.int32)
-                elif numBytesPerPolyVInd == 2:
-                    #  unsigned short
-                    byte = file.read(out_numNodes * numBytesPerPolyVInd)
-                    # WARNING: not sure if it's correct
-                    # uncovered branch from test data
-                    out_polyVIndices = np.frombuffer(byte, dtype=np.uint16)
-                else:
-                    return -127
-
-                mesh.vertices.add(out_numVertices)
-                mesh.vertices.foreach_set('co', out_vertPositions)
-
-                mesh.loops.add(out_numNodes)
-                mesh.loops.foreach_set('vertex_index', out_polyVIndices)
-
-                mesh.polygons.add(out_numPolygons)
-                mesh.polygons.foreach_set('loop_total', out_polyVIndicesNum)
-                faces_loop_start = None
-
-                if out_polyVIndicesNum.size > 0:
-                    faces_loop_start = np.cumsum(out_polyVIndicesNum)
-                    faces_loop_start = np.roll(faces_loop_start, 1)
-                    faces_loop_start[0] = 0
-                mesh.polygons.foreach_set('loop_start', faces_loop_start)
-                mesh.polygons.foreach_set("use_smooth", [shade_scheme] * out_numPolygons)
-                mesh.update()
-                mesh.validate()
-
-            elif chunkID == 0xDA7A0001:  # vertex normals.
-                byte = file.read(4)
-                out_numVerticeAttributes = int.from_bytes(byte, byteorder='little')
-                if out_numVerticeAttributes != out_numVertices:
-                    return -127
-
-                byte = file.read(out_numVerticeAttributes * 6)
-                out_vertAttribute = np.frombuffer(byte, dtype=np.uint16)
-                out_vertAttribute = table[out_vertAttribute]
-                # point_data['normal'] = out_vertAttribute.reshape((out_numVerticeAttributes, 3))
-
-            elif chunkID == 0xDA7A0002:  # vertex motions
-                byte = file.read(4)
-                out_numVerticeAttributes = int.from_bytes(byte, byteorder='little')
-                if out_numVerticeAttributes != out_numVertices:
-                    return -127
-
-                byte = file.read(out_numVerticeAttributes * 6)
-                out_vertAttribute = np.frombuffer(byte, dtype=np.uint16)
-                out_vertAttribute = table[out_vertAttribute]
-                # point_data['velocity'] = out_vertAttribute.reshape((out_numVerticeAttributes, 3))
-
-            elif chunkID == 0xDA7A0003:  # vertex colors
-                byte = file.read(4)
-                out_numVerticeAttributes = int.from_bytes(byte, byteorder='little')
-                if out_numVerticeAttributes != out_numVertices:
-                    return -127
-
-                byte = file.read(out_numVerticeAttributes * 8)
-                out_vertAttribute = np.frombuffer(byte, dtype=np.uint16)
-                out_vertAttribute = table[out_vertAttribute]
-                # point_data['color'] = out_vertAttribute.reshape((out_numVerticeAttributes, 3))
-
-            elif chunkID == 0xDA7A0004:  # vertex UVWs.
-                byte = file.read(4)
-                out_numVerticeAttributes = int.from_bytes(byte, byteorder='little')
-                if out_numVerticeAttributes != out_numVertices:
-                    return -127
-
-                byte = file.read(out_numVerticeAttributes * 12)
-                out_vertAttribute = np.frombuffer(byte, dtype=np.float32)
-                # point_data['uvw_map'] = out_vertAttribute.reshape((out_numVerticeAttributes, 3))
-
-            elif chunkID == 0xDA7A0011:  # node normals.
-                file.seek(size, 1)
-                print(6)
-                pass
-            elif chunkID == 0xDA7A0013:  # node colors.
-                file.seek(size, 1)
-                print(7)
-                pass
-            elif chunkID == 0xDA7A0014:  # node UVWs.
-                file.seek(size, 1)
-                print(8)
-                pass
-            else:
-                # print(name)
-                file.seek(size, 1)
-                pass
+def readMZD_to_meshio(filepath):
+    chunks = read_mzd_chunks(filepath)
+    _, loop_total, loops = chunks["vertices"]
+    positions = get_positions(chunks)
+    num_vertices = len(positions)
+    if num_vertices == 0:
+        return meshio.Mesh(np.empty((0, 3), dtype=np.float32), [])
+
+    cells = []
+    blocks = get_polygon_blocks(loop_total, loops)
+    for n, _, block in blocks:
+        if n == 3:
+            cells.append(meshio.CellBlock('triangle', block))
+        elif n == 4:
+            cells.append(meshio.CellBlock('quad', block))
+        elif n > 4:
+            cells.append(meshio.CellBlock('polygon', block))
+
+    point_data, field_data = get_mzd_attributes(chunks, blocks)
+    return meshio.Mesh(positions, cells, point_data, field_data=field_data)
+
+
+def readMZD_to_arrays(filepath):
+    '''
+    Returns the arrays of the Blender mesh of an mzd file, the same mesh as the one of readMZD_to_meshio
+    '''
+    chunks = read_mzd_chunks(filepath)
+    _, loop_total, loops = chunks["vertices"]
+    positions = get_positions(chunks)
+    blocks = get_polygon_blocks(loop_total, loops) if len(positions) > 0 else []
+
+    n_poly = sum(len(block) for _, _, block in blocks)
+    n_loop = sum(block.size for _, _, block in blocks)
+    face_loops = np.empty(n_loop, dtype=np.int32)
+    face_loop_total = np.empty(n_poly, dtype=np.int32)
+    loop = 0
+    poly = 0
+    for n, _, block in blocks:
+        face_loops[loop:loop + block.size] = block.ravel()
+        face_loop_total[poly:poly + len(block)] = n
+        loop += block.size
+        poly += len(block)
+    face_loop_start = np.zeros(n_poly, dtype=np.int32)
+    np.cumsum(face_loop_total[:-1], dtype=np.int32, out=face_loop_start[1:])
+
+    arrays = {
+        "co": positions,
+        "edges": np.empty(0, dtype=np.int32),
+        "loops": face_loops,
+        "loop_start": face_loop_start,
+        "loop_total": face_loop_total,
+    }
+    point_data, field_data = get_mzd_attributes(chunks, blocks)
+    for k, v in point_data.items():
+        arrays["point:" + k] = v
+    for k, v in field_data.items():
+        arrays["field:" + k] = v
+    return arrays
 
 
 # no need for write function
-meshio.register_format("mzd", [".mzd"], readMZD_to_meshio, {".mzd": None})
\ No newline at end of file
+meshio.register_format("mzd", [".mzd"], readMZD_to_meshio, {".mzd": None})
+array_readers[".mzd"] = readMZD_to_arrays
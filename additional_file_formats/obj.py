@@ -2,7 +2,15 @@
 I/O for the Wavefront .obj file format, cf.
 <https://en.wikipedia.org/wiki/Wavefront_.obj_file>.
 """
+import concurrent.futures
 import datetime
+import logging
+import multiprocessing
+import os
+import threading
+import warnings
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
 
 import numpy as np
 
@@ -11,12 +19,413 @@ import numpy as np
 # from .._mesh import CellBlock, Mesh
 
 import meshio
+from . import parallel_readers
+
+
+logger = logging.getLogger(__name__)
+
+
+class LayoutError(ValueError):
+    """The file doesn't have the regular layout the bulk parser expects, it has to be read by read_buffer."""
 
 
 def read(filename):
+    with open(filename, "rb") as f:
+        data = bytearray(os.fstat(f.fileno()).st_size)
+        f.readinto(data)
+    if len(data) > 0:
+        try:
+            return read_bytes(data)
+        except LayoutError as e:
+            log_fallback(filename, e)
+    with open(filename, "r") as f:
+        return read_buffer(f)
+
+
+def log_fallback(filename, error):
+    # the line parser gives the same mesh, only much slower, so say why it's used
+    logger.warning("%s is read by the line parser, the bulk parser can't read it: %s", filename, error)
+
+
+# bytes of the file that are looked at at once when counting tokens
+chunk_size = 1 << 24
+
+# line keywords the bulk parser looks at
+LINE_OTHER, LINE_V, LINE_VN, LINE_VT, LINE_F, LINE_G = range(6)
+
+# bytes up to the space are whitespace, this includes control characters, which don't appear in obj files
+SPACE = ord(" ")
+
+
+def parse_numbers(data, dtype, what):
+    """Parses whitespace separated numbers, raises LayoutError if data contains anything else."""
+    with warnings.catch_warnings():
+        # numpy < 2.3 only warns if it can't parse everything, later versions raise a ValueError
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            return np.fromstring(data, dtype=dtype, sep=" ")
+        except (ValueError, DeprecationWarning):
+            raise LayoutError("{} that aren't plain numbers".format(what)) from None
+
+
+def lexmax_row(a):
+    """Returns the lexicographically largest row of a, i.e. max() of the rows as lists."""
+    candidates = np.arange(len(a))
+    for column in range(a.shape[1]):
+        values = a[candidates, column]
+        candidates = candidates[values == values.max()]
+    return a[candidates[0]]
+
+
+def read_bytes(data):
+    """
+    Bulk parser for the common layout of large files: all lines of a kind have the same number of values and
+    all faces use the same index form (1, 1/2, 1//3 or 1/2/3). Instead of splitting lines in Python, the lines are
+    classified by their first bytes, and the numbers of all lines of a kind are converted at once. Returns the same
+    mesh as read_buffer (but with the field data obj:vt and obj:vn as arrays instead of lists of rows). Raises
+    LayoutError if the file doesn't have this layout.
+    """
+    if len(data) == 0:
+        raise LayoutError("the file is empty")
+    return build_mesh([parse_lines(data)])
+
+
+def parse_lines(data):
+    """
+    Parses the lines of data (whole lines of an obj file) with the bulk parser. Returns a dict with the values of
+    the v, vn and vt lines, the number of vertices (face_sizes) and the number of preceding g lines (group_counts)
+    of every face, the face indices (n_vertices x values per vertex), the index form of the faces and the number
+    of g lines. Raises LayoutError if data doesn't have the layout read_bytes expects.
+    """
+    if not isinstance(data, bytearray):
+        data = bytearray(data)
+    arr = np.frombuffer(data, dtype=np.uint8)
+    n_data = len(arr)
+    part = {"n_groups": 0, "form": None, "indices": None}
+    if n_data == 0:
+        for k in ("v", "vn", "vt"):
+            part[k] = np.array([])
+        part["face_sizes"] = part["group_counts"] = np.empty(0, dtype=np.int64)
+        return part
+
+    # the line ranges [starts, ends) include the newline, the last line may not have one
+    ends = np.flatnonzero(arr == ord("\n")) + 1
+    if len(ends) == 0 or ends[-1] != n_data:
+        ends = np.append(ends, n_data)
+    starts = np.empty(len(ends), dtype=np.int64)
+    starts[0] = 0
+    starts[1:] = ends[:-1]
+
+    # tokens per line, a token starts with a non-whitespace byte after whitespace.
+    # Counted in chunks of lines, so that the temporary arrays stay small
+    tokens = np.empty(len(starts), dtype=np.int64)
+    # the first line of every chunk, i.e. the lines that contain the bytes at multiples of chunk_size
+    chunks = np.unique(np.searchsorted(starts, np.arange(0, n_data, chunk_size), side="right") - 1)
+    for l0, l1 in zip(chunks, np.append(chunks[1:], len(starts))):
+        non_ws = arr[starts[l0]:ends[l1 - 1]] > SPACE
+        token_start = non_ws.copy()
+        token_start[1:] &= ~non_ws[:-1]
+        tokens[l0:l1] = np.add.reduceat(token_start, starts[l0:l1] - starts[l0], dtype=np.int64)
+
+    def byte_at(offset):
+        i = starts + offset
+        return np.where(i < ends, arr[np.minimum(i, n_data - 1)], ord("\n"))
+
+    c0 = byte_at(0)
+    c1 = byte_at(1)
+    c2 = byte_at(2)
+    if np.any((c0 <= SPACE) & (tokens > 0)):
+        raise LayoutError("indented lines")
+    kind = np.full(len(starts), LINE_OTHER, dtype=np.uint8)
+    kind[(c0 == ord("v")) & (c1 <= SPACE)] = LINE_V
+    kind[(c0 == ord("v")) & (c1 == ord("n")) & (c2 <= SPACE)] = LINE_VN
+    kind[(c0 == ord("v")) & (c1 == ord("t")) & (c2 <= SPACE)] = LINE_VT
+    kind[(c0 == ord("f")) & (c1 <= SPACE)] = LINE_F
+    kind[(c0 == ord("g")) & (c1 <= SPACE)] = LINE_G
+
+    # blank the keywords, so that only the numbers are left
+    for k, keyword_length in ((LINE_V, 1), (LINE_VN, 2), (LINE_VT, 2), (LINE_F, 1)):
+        for i in range(keyword_length):
+            arr[starts[kind == k] + i] = SPACE
+
+    def get_bytes(k):
+        lines = np.flatnonzero(kind == k)
+        if len(lines) > 0 and lines[-1] - lines[0] + 1 == len(lines):
+            # the lines are next to each other, as written by most exporters
+            return arr[starts[lines[0]]:ends[lines[-1]]].tobytes()
+        return arr[np.repeat(kind == k, ends - starts)].tobytes()
+
+    def read_values(k, name):
+        counts = tokens[kind == k] - 1
+        if len(counts) == 0:
+            return np.array([])
+        if np.any(counts != counts[0]):
+            raise LayoutError("{} lines with different numbers of values".format(name))
+        values = parse_numbers(get_bytes(k), np.float64, name + " lines with values")
+        if len(values) != len(counts) * counts[0]:
+            raise LayoutError("{} lines with values that aren't plain numbers".format(name))
+        return values.reshape(len(counts), counts[0])
+
+    for name, k in (("v", LINE_V), ("vn", LINE_VN), ("vt", LINE_VT)):
+        part[name] = read_values(k, name)
+
+    # faces
+    face_lines = np.flatnonzero(kind == LINE_F)
+    face_sizes = tokens[face_lines] - 1
+    if np.any(face_sizes == 0):
+        raise LayoutError("f lines without indices")
+    if len(face_lines) > 0:
+        first = bytes(arr[starts[face_lines[0]]:ends[face_lines[0]]]).split()[0]
+        form = first.split(b"/")
+        if len(form) > 3:
+            raise LayoutError("face vertices with more than 3 indices")
+        has_vt = len(form) > 1 and form[1] != b""
+        has_vn = len(form) > 2
+        n_vertices = int(face_sizes.sum())
+        face_bytes = get_bytes(LINE_F)
+        if face_bytes.count(b"/") != n_vertices * (len(form) - 1) or \
+                face_bytes.count(b"//") != (n_vertices if has_vn and not has_vt else 0):
+            raise LayoutError("faces with different index forms")
+        values_per_vertex = 1 + has_vt + has_vn
+        indices = parse_numbers(face_bytes.replace(b"/", b" "), np.int64, "f lines with indices")
+        del face_bytes
+        if len(indices) != n_vertices * values_per_vertex:
+            raise LayoutError("f lines with indices that aren't plain numbers")
+        part["indices"] = indices.reshape(n_vertices, values_per_vertex)
+        part["form"] = (len(form), has_vt, has_vn)
+
+    is_group = kind == LINE_G
+    part["face_sizes"] = face_sizes
+    part["group_counts"] = np.cumsum(is_group)[face_lines]
+    part["n_groups"] = int(np.count_nonzero(is_group))
+    return part
+
+
+def concatenate_values(values, name):
+    """Concatenates the values of consecutive parts of a file, raises LayoutError if the number of values differs."""
+    values = [v for v in values if len(v) > 0]
+    if not values:
+        return np.array([])
+    if any(v.shape[1] != values[0].shape[1] for v in values):
+        raise LayoutError("{} lines with different numbers of values".format(name))
+    return np.concatenate(values)
+
+
+def build_mesh(parts):
+    """
+    Builds the mesh of read_bytes from the results of parse_lines for consecutive parts of a file. Raises
+    LayoutError if the parts don't have the same layout.
+    """
+    points = concatenate_values([p["v"] for p in parts], "v")
+    vertex_normals = concatenate_values([p["vn"] for p in parts], "vn")
+    texture_coords = concatenate_values([p["vt"] for p in parts], "vt")
+
+    # faces
+    forms = set(p["form"] for p in parts if p["form"] is not None)
+    if len(forms) > 1:
+        raise LayoutError("faces with different index forms")
+    _, has_vt, has_vn = forms.pop() if forms else (1, False, False)
+    values_per_vertex = 1 + has_vt + has_vn
+    indices = [p["indices"] for p in parts if p["indices"] is not None]
+    indices = indices[0] if len(indices) == 1 else np.concatenate(indices) if indices else None
+    face_sizes = np.concatenate([p["face_sizes"] for p in parts])
+    # the g lines before every face, the ones of earlier parts included
+    group_offsets = np.cumsum([0] + [p["n_groups"] for p in parts[:-1]])
+    group_counts = np.concatenate([p["group_counts"] + offset for p, offset in zip(parts, group_offsets)])
+
+    # a new block of faces starts after every group line and whenever the number of vertices changes
+    new_block = np.ones(len(face_sizes), dtype=bool)
+    new_block[1:] = (face_sizes[1:] != face_sizes[:-1]) | (group_counts[1:] != group_counts[:-1])
+    block_starts = np.flatnonzero(new_block)
+    block_ends = np.append(block_starts[1:], len(face_sizes))
+    vertex_offsets = np.zeros(len(face_sizes) + 1, dtype=np.int64)
+    np.cumsum(face_sizes, out=vertex_offsets[1:])
+
+    face_groups = []
+    face_group_ids = []
+    face_texture_coords = []
+    face_normals = []
+    for b0, b1 in zip(block_starts, block_ends):
+        block = indices[vertex_offsets[b0]:vertex_offsets[b1]].reshape(b1 - b0, face_sizes[b0], values_per_vertex)
+        face_groups.append(block[:, :, 0])
+        face_group_ids.append(np.full(b1 - b0, group_counts[b0] - 1))
+        if has_vt:
+            face_texture_coords.append(block[:, :, 1])
+        if has_vn:
+            face_normals.append(block[:, :, -1])
+
+    point_data = {}
+    cell_data = {}
+    field_data = {}
+
+    # the same checks as in read_buffer, max() of a list of faces is the lexicographically largest face
+    if face_texture_coords and len(texture_coords) == max([lexmax_row(face).max() for face in face_texture_coords]):
+        field_data["obj:vt"] = texture_coords
+        cell_data["obj:vt_face_idx"] = face_texture_coords
+    elif len(texture_coords) == len(points):
+        point_data["obj:vt"] = texture_coords
+
+    if face_normals and len(vertex_normals) == max([lexmax_row(face).max() for face in face_normals]):
+        field_data["obj:vn"] = vertex_normals
+        cell_data["obj:vn_face_idx"] = face_normals
+    elif len(vertex_normals) == len(points):
+        point_data["obj:vn"] = vertex_normals
+
+    cell_data["obj:group_ids"] = []
+    cells = []
+    for f, gid in zip(face_groups, face_group_ids):
+        if f.shape[1] == 3:
+            cells.append(meshio.CellBlock("triangle", f - 1))
+        elif f.shape[1] == 4:
+            cells.append(meshio.CellBlock("quad", f - 1))
+        else:
+            cells.append(meshio.CellBlock("polygon", f - 1))
+        cell_data["obj:group_ids"].append(gid)
+
+    return meshio.Mesh(points, cells, point_data=point_data, cell_data=cell_data, field_data=field_data)
+
+
+# parallel parsing: files are split into parts of whole lines, which are parsed by parse_lines in worker
+# processes. The resulting arrays are handed back in shared memory instead of being pickled.
+
+# worker processes of read_parallel
+max_workers = max(1, min(8, os.cpu_count() or 1))
+
+# files smaller than 16 MiB are read by read in this process, splitting them costs more than it saves
+min_parallel_size = 16 * 1024 * 1024
+
+# created on the first read_parallel of a large file and reused for all later ones, so the workers are
+# only started (and import numpy and meshio) once per session, not for every frame
+_executor = None
+# read_parallel is also called from the prefetch threads
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """Returns the process pool of read_parallel, it's started on the first call."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            # forking Blender is not safe, the workers import this module in a fresh interpreter
+            _executor = concurrent.futures.ProcessPoolExecutor(max_workers=max_workers,
+                                                               mp_context=multiprocessing.get_context("spawn"))
+        return _executor
+
+
+def shutdown():
+    """Stops the worker processes, the addon calls this when it's unregistered."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+
+def discard_executor(executor):
+    """
+    Shuts down a pool whose worker died, e.g. killed by the system when it ran out of memory. The next call
+    of get_executor starts a new one, unless another thread already did.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is executor:
+            _executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def share_array(array):
+    """Copies array into a new shared memory block, returns (block name, dtype, shape) to pass it to another process."""
+    if array.nbytes == 0:
+        return None, array.dtype.str, array.shape
+    block = shared_memory.SharedMemory(create=True, size=array.nbytes)
+    np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+    block.close()
+    return block.name, array.dtype.str, array.shape
+
+
+def take_shared_array(shared):
+    """Returns a copy of an array of share_array and frees its shared memory block."""
+    name, dtype, shape = shared
+    if name is None:
+        return np.empty(shape, dtype=dtype)
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        return np.ndarray(shape, dtype=dtype, buffer=block.buf).copy()
+    finally:
+        block.close()
+        block.unlink()
+
+
+def parse_part(filename, start, end):
+    """
+    Runs parse_lines on the bytes [start, end) of a file in a worker process. Returns the values that aren't
+    arrays and the arrays as shared by share_array. Raises LayoutError if the part doesn't have the layout of
+    read_bytes.
+    """
+    with open(filename, "rb") as f:
+        f.seek(start)
+        data = bytearray(end - start)
+        f.readinto(data)
+    part = parse_lines(data)
+    del data
+    values = {k: v for k, v in part.items() if not isinstance(v, np.ndarray)}
+    arrays = {k: share_array(v) for k, v in part.items() if isinstance(v, np.ndarray)}
+    return values, arrays
+
+
+def get_part_bounds(filename, n):
+    """Splits a file into at most n parts of whole lines of about the same size, returns their byte ranges."""
+    size = os.path.getsize(filename)
+    bounds = [0]
+    with open(filename, "rb") as f:
+        for i in range(1, n):
+            f.seek(size * i // n)
+            # the part ends after the line that contains this byte
+            f.readline()
+            if f.tell() > bounds[-1] and f.tell() < size:
+                bounds.append(f.tell())
+    bounds.append(size)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def read_parallel(filename):
+    """
+    Reads an obj file like read, but files of at least min_parallel_size bytes are parsed in parallel by the
+    max_workers processes of the shared pool (see get_executor). Files that don't have the layout of read_bytes
+    are read by read_buffer.
+    """
+    if max_workers < 2 or os.path.getsize(filename) < min_parallel_size:
+        return read(filename)
+    executor = get_executor()
+    futures = []
+    error = None
+    try:
+        for start, end in get_part_bounds(filename, max_workers):
+            futures.append(executor.submit(parse_part, filename, start, end))
+    except BrokenProcessPool as e:
+        error = e
+    parts = []
+    # collect all parts before raising, their shared memory has to be freed in any case
+    for future in futures:
+        try:
+            values, arrays = future.result()
+        except Exception as e:
+            error = error or e
+            continue
+        values.update((k, take_shared_array(v)) for k, v in arrays.items())
+        parts.append(values)
+    if isinstance(error, BrokenProcessPool):
+        discard_executor(executor)
+        logger.warning("The worker processes stopped while reading %s, it's read by a single process", filename)
+        return read(filename)
+    try:
+        if error is not None:
+            raise error
+        return build_mesh(parts)
+    except LayoutError as e:
+        log_fallback(filename, e)
     with open(filename, "r") as f:
-        mesh = read_buffer(f)
-    return mesh
+        return read_buffer(f)
 
 
 def read_buffer(f):
@@ -133,3 +542,4 @@ def read_buffer(f):
     return meshio.Mesh(points, cells, point_data=point_data, cell_data=cell_data, field_data=field_data)
 
 meshio.register_format("obj", [".obj"], read, {"obj": None})
+parallel_readers[".obj"] = read_parallel
@@ -0,0 +1,121 @@
+import numpy as np
+
+#  Face deduplication for volumetric cells. Instead of np.unique(axis=0), which compares whole
+#  rows and is very slow and memory hungry for millions of faces, the sorted vertex ids of every
+#  face are packed into one or more uint64 keys, so that duplicates can be found with a plain
+#  argsort. Keys are built in chunks of elements, and the full face table is never materialized.
+
+# number of elements whose faces are packed at once
+chunk_size = 1 << 20
+
+
+def get_key_layout(width, max_index):
+    '''
+    Returns (bits per vertex id, vertex ids per uint64 word, number of words) for faces of width vertices
+    '''
+    bits = max(int(max_index).bit_length(), 1)
+    per_word = max(64 // bits, 1)
+    n_words = -(-width // per_word)
+    return bits, per_word, n_words
+
+
+def pack_face_keys(blocks):
+    '''
+    Packs the sorted vertex ids of every local face of every element into uint64 words.
+    blocks is a list of (data, local_faces), the keys of face f of element e of a block are
+    stored in a contiguous segment per (block, f). Returns the words and the segment start offsets.
+    '''
+    width = blocks[0][1].shape[1]
+    max_index = max(data.max() for data, _ in blocks)
+    bits, per_word, n_words = get_key_layout(width, max_index)
+    shift = np.uint64(bits)
+
+    segments = [0]
+    for data, local_faces in blocks:
+        for _ in local_faces:
+            segments.append(segments[-1] + len(data))
+    words = [np.zeros(segments[-1], dtype=np.uint64) for _ in range(n_words)]
+
+    segment = 0
+    for data, local_faces in blocks:
+        n_elem = len(data)
+        for local in local_faces:
+            offset = segments[segment]
+            segment += 1
+            for start in range(0, n_elem, chunk_size):
+                stop = min(start + chunk_size, n_elem)
+                block = np.sort(data[start:stop][:, local], axis=1).astype(np.uint64, copy=False)
+                out = slice(offset + start, offset + stop)
+                for w in range(n_words):
+                    key = words[w][out]
+                    for c in range(w * per_word, min((w + 1) * per_word, width)):
+                        key <<= shift
+                        key |= block[:, c]
+    return words, np.array(segments)
+
+
+def sort_keys(words):
+    '''
+    Returns the stable sorting order of the keys and a mask that is True where
+    a sorted key equals its predecessor
+    '''
+    if len(words) == 1:
+        order = np.argsort(words[0], kind="stable")
+    else:
+        # lexsort uses the last key as primary key
+        order = np.lexsort(words[::-1])
+    same = np.ones(len(order) - 1, dtype=bool)
+    for w in words:
+        sorted_w = w[order]
+        same &= sorted_w[1:] == sorted_w[:-1]
+    return order, same
+
+
+def boundary_face_indices(blocks):
+    '''
+    Finds the faces that belong to exactly one element, i.e. the boundary surface, of all blocks together.
+    blocks is a list of (data, local_faces), where data is n_elements x n_nodes and local_faces lists the
+    node indices of each face of an element. All faces must have the same number of vertices.
+    Returns a list with (element indices, local face indices) of the boundary faces of every block.
+    '''
+    blocks = [(np.asarray(data), np.asarray(local_faces)) for data, local_faces in blocks]
+    empty = (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64))
+    if not any(len(data) > 0 and len(local_faces) > 0 for data, local_faces in blocks):
+        return [empty for _ in blocks]
+    keyed = [i for i, (data, local_faces) in enumerate(blocks) if len(data) > 0 and len(local_faces) > 0]
+
+    words, segments = pack_face_keys([blocks[i] for i in keyed])
+    order, same = sort_keys(words)
+    once = np.ones(len(order), dtype=bool)
+    once[1:] &= ~same
+    once[:-1] &= ~same
+    idx = np.sort(order[once])
+
+    # idx is sorted, so the faces of each (block, local face) segment are contiguous
+    bounds = np.searchsorted(idx, segments)
+    result = [empty for _ in blocks]
+    segment = 0
+    for i in keyed:
+        data, local_faces = blocks[i]
+        lo = bounds[segment]
+        hi = bounds[segment + len(local_faces)]
+        local = np.repeat(np.arange(len(local_faces)), np.diff(bounds[segment:segment + len(local_faces) + 1]))
+        elem = idx[lo:hi] - segments[segment + local]
+        result[i] = (elem, local)
+        segment += len(local_faces)
+    return result
+
+
+def unique_faces(faces):
+    '''
+    Returns the indices of the first occurrence of every face, ignoring the orientation of the faces
+    '''
+    faces = np.asarray(faces)
+    if len(faces) == 0:
+        return np.empty(0, dtype=np.int64)
+    local_faces = np.arange(faces.shape[1])[None, :]
+    words, _ = pack_face_keys([(faces, local_faces)])
+    order, same = sort_keys(words)
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = ~same
+    return np.sort(order[first])
@@ -1,11 +1,11 @@
 from bseq.utils import refresh_obj
-from .operators import BSEQ_OT_load, BSEQ_OT_edit, BSEQ_OT_resetpt, BSEQ_OT_resetmesh, BSEQ_OT_resetins, BSEQ_OT_set_as_split_norm, BSEQ_OT_remove_split_norm, BSEQ_OT_disable_selected, BSEQ_OT_enable_selected, BSEQ_OT_refresh_seq, BSEQ_OT_disable_all, BSEQ_OT_enable_all, BSEQ_OT_refresh_sequences, BSEQ_OT_set_start_end_frames, BSEQ_OT_batch_sequences, BSEQ_PT_batch_sequences_settings, BSEQ_OT_meshio_object, BSEQ_OT_import_zip, BSEQ_OT_delete_zips, BSEQ_addon_preferences, BSEQ_OT_load_all, BSEQ_OT_load_all_recursive
+from .operators import BSEQ_OT_load, BSEQ_OT_edit, BSEQ_OT_resetpt, BSEQ_OT_resetmesh, BSEQ_OT_resetins, BSEQ_OT_set_as_split_norm, BSEQ_OT_remove_split_norm, BSEQ_OT_disable_selected, BSEQ_OT_enable_selected, BSEQ_OT_refresh_seq, BSEQ_OT_disable_all, BSEQ_OT_enable_all, BSEQ_OT_refresh_sequences, BSEQ_OT_set_start_end_frames, BSEQ_OT_batch_sequences, BSEQ_PT_batch_sequences_settings, BSEQ_OT_meshio_object, BSEQ_OT_import_zip, BSEQ_OT_delete_zips, BSEQ_addon_preferences, BSEQ_OT_load_all, BSEQ_OT_load_all_recursive, BSEQ_OT_clear_cache, BSEQ_OT_bake
 from .properties import BSEQ_scene_property, BSEQ_obj_property, BSEQ_mesh_property
 from .panels import BSEQ_UL_Obj_List, BSEQ_List_Panel, BSEQ_Settings, BSEQ_PT_Import, BSEQ_PT_Import_Child1, BSEQ_PT_Import_Child2, BSEQ_Globals_Panel, BSEQ_Advanced_Panel, BSEQ_Templates, BSEQ_UL_Att_List, draw_template
 from .messenger import subscribe_to_selected, unsubscribe_to_selected
 import bpy
 from bpy.app.handlers import persistent
-from .importer import update_obj
+from .importer import update_obj, render_started, render_stopped
 from .globals import *    
 
 
@@ -22,6 +22,12 @@ def BSEQ_initialize(scene):
     subscribe_to_selected()
     if print_information not in bpy.app.handlers.render_init:
         bpy.app.handlers.render_init.append(print_information)
+    if render_started not in bpy.app.handlers.render_init:
+        bpy.app.handlers.render_init.append(render_started)
+    if render_stopped not in bpy.app.handlers.render_complete:
+        bpy.app.handlers.render_complete.append(render_stopped)
+    if render_stopped not in bpy.app.handlers.render_cancel:
+        bpy.app.handlers.render_cancel.append(render_stopped)
 
 
 __all__ = [
@@ -63,5 +69,7 @@ __all__ = [
     "BSEQ_OT_delete_zips",
     "BSEQ_addon_preferences",
     "BSEQ_OT_load_all",
-    "BSEQ_OT_load_all_recursive"
+    "BSEQ_OT_load_all_recursive",
+    "BSEQ_OT_clear_cache",
+    "BSEQ_OT_bake",
 ]
@@ -0,0 +1,226 @@
+import json
+import os
+import zlib
+import numpy as np
+
+#  Baked frame cache. A sequence can be converted into one .bseq file per frame that holds the
+#  arrays exactly as they are passed to foreach_set, so playing it back needs no parsing, face
+#  extraction or loop assembly. Every file starts with a small JSON header that describes the
+#  arrays, which follow at 64 byte aligned offsets and are read as numpy.memmap views.
+#
+#  b"BSEQBAKE" | header length (uint64) | JSON header | padding | array | padding | array ...
+#
+#  Arrays that are identical to the ones of the previous frame, e.g. the connectivity of a fixed
+#  mesh, are only stored once: later frames refer to the file that holds them ("file"). Vertex
+#  positions can optionally be stored as the compressed difference to the last key frame.
+#
+#  For fast scrubbing in the viewport, a lossy copy of every frame can be baked next to it, which
+#  stores positions and attributes as 16 and 8 bit integers relative to their per-frame range.
+#  All other arrays are shared with the exact frame.
+
+magic = b"BSEQBAKE"
+version = 2
+alignment = 64
+extension = ".bseq"
+# every n-th frame stores its positions in full when delta encoding
+delta_key_interval = 16
+# bits per value of the quantized copy
+position_bits = 16
+attribute_bits = 8
+
+
+def get_bake_path(bake_dir, filepath, quantized=False):
+    '''
+    Returns the path of the baked frame of filepath inside bake_dir
+    '''
+    return os.path.join(bake_dir, os.path.basename(filepath) + (".q" if quantized else "") + extension)
+
+
+def align(offset):
+    return -(-offset // alignment) * alignment
+
+
+def encode_delta(array, key):
+    '''
+    Losslessly encodes array as the xor of its bits with key. The bytes are shuffled, so that the
+    bytes that hardly change between frames (sign and exponent) end up next to each other.
+    '''
+    bits = array.view(np.uint32) ^ key.view(np.uint32)
+    return zlib.compress(bits.view(np.uint8).reshape(-1, 4).T.tobytes(), 1)
+
+
+def decode_delta(data, key):
+    bits = np.frombuffer(zlib.decompress(data), dtype=np.uint8).reshape(4, -1).T.copy().view(np.uint32)
+    return (bits.reshape(key.shape) ^ key.view(np.uint32)).view(key.dtype)
+
+
+def quantize(array, bits):
+    '''
+    Returns the block description of array quantized to unsigned integers of bits bits, per column
+    '''
+    values = array.reshape(len(array), -1)
+    low = values.min(axis=0)
+    scale = (values.max(axis=0) - low) / float((1 << bits) - 1)
+    # constant columns
+    inv_scale = np.divide(1.0, scale, out=np.zeros_like(scale), where=scale > 0)
+    stored = np.dtype(np.uint16 if bits > 8 else np.uint8)
+    q = np.rint((values - low) * inv_scale).astype(stored)
+    return {"dtype": "<f4", "shape": list(array.shape), "encoding": "quantized",
+            "stored_dtype": stored.str, "low": low.tolist(), "scale": scale.tolist(), "data": q.data}
+
+
+def dequantize(q, block):
+    '''
+    Decodes a quantized block into float32 values
+    '''
+    values = q.reshape(block["shape"][0], -1).astype(np.float32)
+    values *= np.array(block["scale"], dtype=np.float32)
+    values += np.array(block["low"], dtype=np.float32)
+    return values.reshape(block["shape"])
+
+
+def write_frame(filepath, arrays, meta=None):
+    '''
+    Writes the arrays and the JSON serializable meta data into filepath. The arrays are either ndarrays,
+    or block descriptions (dicts) of shared or encoded blocks, whose payload is stored under "data"
+    '''
+    blocks = {}
+    payloads = {}
+    relative = {}
+    offset = 0
+    for name, array in arrays.items():
+        if isinstance(array, dict):
+            block = dict(array)
+            payload = block.pop("data", None)
+        else:
+            array = np.ascontiguousarray(array)
+            block = {"dtype": array.dtype.str, "shape": list(array.shape)}
+            payload = array.data
+        blocks[name] = block
+        if payload is None:
+            continue
+        payloads[name] = payload
+        offset = align(offset)
+        relative[name] = offset
+        block["size"] = payload.nbytes if isinstance(payload, memoryview) else len(payload)
+        offset += block["size"]
+    header = {"version": version, "meta": meta or {}, "blocks": blocks}
+    # the offsets are stored in the header, so its size depends on them
+    start = 0
+    while True:
+        for name in payloads:
+            blocks[name]["offset"] = start + relative[name]
+        header_bytes = json.dumps(header).encode()
+        end = align(len(magic) + 8 + len(header_bytes))
+        if end <= start:
+            break
+        start = end
+
+    tmp_path = filepath + ".tmp"
+    with open(tmp_path, "wb") as file:
+        file.write(magic)
+        file.write(np.uint64(len(header_bytes)).tobytes())
+        file.write(header_bytes)
+        for name, payload in payloads.items():
+            file.write(b"\0" * (blocks[name]["offset"] - file.tell()))
+            file.write(payload)
+    # readers never see a half-written frame
+    os.replace(tmp_path, filepath)
+
+
+def read_header(filepath):
+    with open(filepath, "rb") as file:
+        if file.read(len(magic)) != magic:
+            raise ValueError("Not a baked frame: " + filepath)
+        length = int(np.frombuffer(file.read(8), dtype=np.uint64)[0])
+        header = json.loads(file.read(length))
+    if header["version"] > version:
+        raise ValueError("Unsupported bake version {} of {}".format(header["version"], filepath))
+    return header
+
+
+def read_block(filepath, name, block):
+    directory = os.path.dirname(filepath)
+    if "offset" not in block:
+        # shared with the frame that stores it
+        other = os.path.join(directory, block["file"])
+        return read_block(other, name, read_header(other)["blocks"][name])
+    shape = tuple(block["shape"])
+    if block.get("encoding") == "xor-zlib":
+        key = read_frame(os.path.join(directory, block["file"]), [name])[1][name]
+        with open(filepath, "rb") as file:
+            file.seek(block["offset"])
+            return decode_delta(file.read(block["size"]), key)
+    if block.get("encoding") == "quantized":
+        q = np.memmap(filepath, dtype=block["stored_dtype"], mode="r", offset=block["offset"],
+                      shape=(block["size"] // np.dtype(block["stored_dtype"]).itemsize,))
+        return dequantize(q, block)
+    if 0 in shape:
+        # empty arrays can't be memory mapped
+        return np.empty(shape, dtype=block["dtype"])
+    return np.memmap(filepath, dtype=block["dtype"], mode="r", offset=block["offset"], shape=shape)
+
+
+def read_frame(filepath, names=None):
+    '''
+    Returns (meta, arrays) of a baked frame, where the arrays are read-only memory mapped views of the file,
+    or of the file that holds a shared array. If names is given, only these arrays are read.
+    '''
+    header = read_header(filepath)
+    arrays = {}
+    for name, block in header["blocks"].items():
+        if names is None or name in names:
+            arrays[name] = read_block(filepath, name, block)
+    return header["meta"], arrays
+
+
+class Baker:
+    '''
+    Writes the frames of a sequence one after another, arrays that did not change since the previous frame
+    are shared instead of stored again. If key_interval > 0, the positions of all frames but every
+    key_interval-th one are stored as the difference to the last key frame. If quantized, the positions and
+    point attributes are quantized and all other arrays are shared with the exact frame.
+    '''
+
+    def __init__(self, key_interval=0, quantized=False):
+        self.key_interval = key_interval
+        self.quantized = quantized
+        # array name -> (array, name of the file that stores it)
+        self.previous = {}
+        # (positions, name of the file) of the last key frame
+        self.key = None
+        self.count = 0
+
+    def write(self, filepath, arrays, meta=None, exact_filepath=None):
+        filename = os.path.basename(filepath)
+        blocks = {}
+        for name, array in arrays.items():
+            array = np.ascontiguousarray(array)
+            if self.quantized:
+                if (name == "co" or name.startswith("point:")) and array.dtype.kind == "f" and len(array) > 0 \
+                        and np.isfinite(array).all():
+                    blocks[name] = quantize(array, position_bits if name == "co" else attribute_bits)
+                else:
+                    blocks[name] = {"file": os.path.basename(exact_filepath)}
+                continue
+            previous = self.previous.get(name)
+            if previous is not None and previous[0].dtype == array.dtype and np.array_equal(previous[0], array):
+                blocks[name] = {"file": previous[1]}
+                continue
+            is_key = self.count % max(self.key_interval, 1) == 0
+            if name == "co" and self.key_interval > 0 and not is_key and self.key is not None and \
+                    self.key[0].shape == array.shape and array.dtype.itemsize == 4:
+                blocks[name] = {"dtype": array.dtype.str, "shape": list(array.shape), "encoding": "xor-zlib",
+                                "file": self.key[1], "data": encode_delta(array, self.key[0])}
+            else:
+                blocks[name] = array
+                if name == "co":
+                    self.key = (array.copy(), filename)
+            # copy, the arrays may be staging buffers that are reused for the next frame
+            self.previous[name] = (array.copy(), filename)
+        # arrays that are missing in this frame can't be shared with the next one
+        for name in list(self.previous):
+            if name not in arrays:
+                del self.previous[name]
+        write_frame(filepath, blocks, meta)
+        self.count += 1
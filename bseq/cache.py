@@ -0,0 +1,130 @@
+import collections
+import os
+import numpy as np
+
+#  In-memory cache of parsed frames, so that revisiting a frame (e.g. when scrubbing) does not
+#  read and parse the file again. Entries are keyed by the identity of the file on disk, i.e.
+#  (absolute path, modification time, size), so a file that is rewritten is read again.
+
+
+def file_key(filepath):
+    '''
+    Returns the identity of the file as (absolute path, mtime, size), or None if it does not exist
+    '''
+    filepath = os.path.abspath(filepath)
+    try:
+        stat = os.stat(filepath)
+    except OSError:
+        return None
+    return (filepath, stat.st_mtime_ns, stat.st_size)
+
+
+def get_nbytes(value):
+    '''
+    Estimates the memory used by the numpy arrays of a parsed frame
+    '''
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sum(get_nbytes(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(get_nbytes(v) for v in value)
+    # meshio.Mesh and meshio.CellBlock
+    if hasattr(value, "points") and hasattr(value, "cells"):
+        return (get_nbytes(value.points) + get_nbytes(value.cells) + get_nbytes(value.point_data) +
+                get_nbytes(value.cell_data) + get_nbytes(value.field_data))
+    if hasattr(value, "data") and hasattr(value, "type"):
+        return get_nbytes(value.data)
+    return 0
+
+
+class FrameCache:
+    '''
+    LRU cache of parsed frames with a memory budget in bytes
+    '''
+
+    def __init__(self, budget):
+        self.budget = budget
+        self.used = 0
+        # key -> (value, nbytes), least recently used first
+        self._entries = collections.OrderedDict()
+        # absolute path -> key, to drop outdated versions of a file
+        self._keys = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, filepath):
+        key = file_key(filepath)
+        return key is not None and key in self._entries
+
+    def get(self, filepath):
+        key = file_key(filepath)
+        if key is None:
+            return None
+        self._invalidate(key)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, filepath, value):
+        key = file_key(filepath)
+        if key is None:
+            return
+        self._invalidate(key)
+        self._remove(key)
+        nbytes = get_nbytes(value)
+        if nbytes > self.budget:
+            return
+        self._entries[key] = (value, nbytes)
+        self._keys[key[0]] = key
+        self.used += nbytes
+        self.evict()
+
+    def set_budget(self, budget):
+        if budget != self.budget:
+            self.budget = budget
+            self.evict()
+
+    def evict(self):
+        while self.used > self.budget and self._entries:
+            self._remove(next(iter(self._entries)))
+
+    def clear(self):
+        self._entries.clear()
+        self._keys.clear()
+        self.used = 0
+
+    def _invalidate(self, key):
+        # the file has changed on disk since it was cached
+        old_key = self._keys.get(key[0])
+        if old_key is not None and old_key != key:
+            self._remove(old_key)
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.used -= entry[1]
+            if self._keys.get(key[0]) == key:
+                del self._keys[key[0]]
+
+
+# scene name -> FrameCache
+_caches = {}
+
+
+def get_cache(scene):
+    budget = scene.BSEQ.frame_cache_size * 1024 * 1024
+    cache = _caches.get(scene.name_full)
+    if cache is None:
+        cache = _caches[scene.name_full] = FrameCache(budget)
+    cache.set_budget(budget)
+    return cache
+
+
+def clear_caches():
+    for cache in _caches.values():
+        cache.clear()
+    _caches.clear()
@@ -0,0 +1,90 @@
+import bisect
+import os
+import bpy
+import fileseq
+from .utils import get_absolute_path
+
+#  Resolved frame -> filepath index of every sequence object. Building a fileseq.FileSequence and
+#  searching its frame set on every frame change is linear in the length of the sequence, so the
+#  index is built once and only rebuilt when the path, pattern or root path of the object changes.
+
+
+class FrameIndex:
+    '''
+    Maps the frames of a file sequence to normalized absolute filepaths
+    '''
+
+    def __init__(self, fs):
+        self.fs = fs
+        # a single file without a frame number, e.g. mesh.obj, has no frame set
+        self.frameless = fs.frameSet() is None
+        self.frames = list(fs.frameSet()) if len(fs) > 0 and not self.frameless else []
+        # frame -> index into the sequence
+        self.indices = {f: i for i, f in enumerate(self.frames)}
+        self.sorted_frames = sorted(self.frames)
+        # filepaths are only formatted when they are needed
+        self.paths = [None] * (len(fs) if self.frameless else len(self.frames))
+
+    def __len__(self):
+        return len(self.paths)
+
+    def get_path(self, i):
+        path = self.paths[i]
+        if path is None:
+            path = self.paths[i] = os.path.normpath(self.fs[i])
+        return path
+
+    def get_filepath(self, current_frame, match_frames):
+        '''
+        Returns the filepath shown at current_frame, or None if there is no file for this frame
+        '''
+        if len(self.paths) == 0:
+            return None
+        if match_frames:
+            # a file without a frame number matches no frame
+            i = self.indices.get(current_frame)
+            return None if i is None else self.get_path(i)
+        return self.get_path(current_frame % len(self.paths))
+
+    def get_next_filepaths(self, current_frame, depth, match_frames):
+        '''
+        Returns the filepaths of the depth frames following current_frame
+        '''
+        if depth <= 0 or len(self.paths) == 0:
+            return []
+        if match_frames:
+            start = bisect.bisect_right(self.sorted_frames, current_frame)
+            return [self.get_path(self.indices[f]) for f in self.sorted_frames[start:start + depth]]
+        depth = min(depth, len(self.paths) - 1)
+        return [self.get_path((current_frame + i) % len(self.paths)) for i in range(1, depth + 1)]
+
+
+# object name -> (key, FrameIndex)
+_indices = {}
+
+
+def get_frame_index(obj, scene):
+    '''
+    Returns the FrameIndex of obj, rebuilding it if the sequence of the object has changed
+    '''
+    # relative paths also depend on the location of the blend file
+    key = (obj.BSEQ.path, obj.BSEQ.pattern, scene.BSEQ.root_path, bpy.data.filepath)
+    entry = _indices.get(obj.name_full)
+    if entry is None or entry[0] != key:
+        # in case the blender file was created on windows system, but opened in linux system
+        full_path = get_absolute_path(obj, scene)
+        entry = _indices[obj.name_full] = (key, FrameIndex(fileseq.FileSequence(full_path)))
+    return entry[1]
+
+
+def discard_frame_indices(keep):
+    '''
+    Drops the indices of all objects whose names are not in keep
+    '''
+    for name in list(_indices):
+        if name not in keep:
+            del _indices[name]
+
+
+def clear_frame_indices():
+    _indices.clear()
@@ -3,7 +3,7 @@
 import bpy
 from datetime import datetime
 import os
-from .utils import refresh_obj
+from .watcher import refresh_if_changed
 
 def print_information(scene):
     if not bpy.context.scene.BSEQ.print:
@@ -39,7 +39,7 @@ def auto_refresh_all(scene, depsgraph=None):
             continue
         if obj.mode != "OBJECT":
             continue
-        refresh_obj(obj, scene)
+        refresh_if_changed(obj, scene)
 
 def auto_refresh_active(scene, depsgraph=None):
     if not bpy.context.scene.BSEQ.auto_refresh_active:
@@ -51,7 +51,7 @@ def auto_refresh_active(scene, depsgraph=None):
             continue
         if obj.mode != "OBJECT":
             continue
-        refresh_obj(obj, scene)
+        refresh_if_changed(obj, scene)
 
 # This becomes necessary, because when deleting objects from the viewport, they dont actually get removed from the
 # sequences list, because this is not a global delete. This handler only removes sequences that are not referenced
@@ -1,13 +1,23 @@
 import bpy
+from bpy.app.handlers import persistent
 import mathutils
 import meshio
 import traceback
 import fileseq
 import os
-from .utils import show_message_box, get_relative_path, get_absolute_path, load_meshio_from_path
+from .utils import show_message_box, get_relative_path, convert_to_absolute_path, load_meshio_from_path
+from . import prefetch
+from .cache import get_cache
+from additional_file_formats.surface import boundary_face_indices
+from .scripts import get_script_module
+from .frames import get_frame_index, discard_frame_indices
+from .bake import read_frame, get_bake_path
 import numpy as np
 from mathutils import Matrix
 import time
+import hashlib
+import zlib
+import collections
 # this import is not useless
 import additional_file_formats
 
@@ -16,43 +26,170 @@ def extract_edges(cell: meshio.CellBlock):
         return cell.data.astype(np.uint64)
     return np.array([])
 
+# cell type -> number of face vertices -> local faces of the element, oriented to point outwards
+volume_faces = {
+    "tetra": {3: [[0, 2, 1], [0, 3, 2], [0, 1, 3], [1, 2, 3]]},
+    "hexahedron": {4: [[0, 3, 2, 1], [1, 5, 4, 0], [4, 5, 6, 7], [3, 7, 6, 2], [1, 2, 6, 5], [0, 4, 7, 3]]},
+    "wedge": {3: [[0, 1, 2], [3, 5, 4]], 4: [[0, 3, 4, 1], [1, 4, 5, 2], [2, 5, 3, 0]]},
+    "pyramid": {3: [[0, 1, 4], [1, 2, 4], [2, 3, 4], [3, 0, 4]], 4: [[0, 3, 2, 1]]},
+}
+
+# higher order cell type -> linear cell type, the corner nodes always come first (VTK node ordering)
+linear_cell_types = {
+    "triangle6": "triangle",
+    "triangle7": "triangle",
+    "quad8": "quad",
+    "quad9": "quad",
+    "tetra10": "tetra",
+    "hexahedron20": "hexahedron",
+    "hexahedron27": "hexahedron",
+}
+
+# higher order surface cell type -> number of face vertices -> sub-faces using the midside (and center) nodes
+subdivided_faces = {
+    "triangle6": {3: [[0, 3, 5], [3, 1, 4], [5, 4, 2], [3, 4, 5]]},
+    "triangle7": {3: [[0, 3, 6], [3, 1, 6], [1, 4, 6], [4, 2, 6], [2, 5, 6], [5, 0, 6]]},
+    "quad8": {3: [[0, 4, 7], [4, 1, 5], [5, 2, 6], [6, 3, 7]], 4: [[4, 5, 6, 7]]},
+    "quad9": {4: [[0, 4, 8, 7], [4, 1, 5, 8], [8, 5, 2, 6], [7, 8, 6, 3]]},
+}
+
+# higher order volume cell type -> (cell type of its faces, local faces including the midside nodes),
+# the faces are in the same order as the faces of the linear cell in volume_faces
+higher_order_volume_faces = {
+    "tetra10": ("triangle6", [[0, 2, 1, 6, 5, 4], [0, 3, 2, 7, 9, 6], [0, 1, 3, 4, 8, 7], [1, 2, 3, 5, 9, 8]]),
+    "hexahedron20": ("quad8", [[0, 3, 2, 1, 11, 10, 9, 8], [1, 5, 4, 0, 17, 12, 16, 8], [4, 5, 6, 7, 12, 13, 14, 15],
+                               [3, 7, 6, 2, 19, 14, 18, 10], [1, 2, 6, 5, 9, 18, 13, 17], [0, 4, 7, 3, 16, 15, 19, 11]]),
+    "hexahedron27": ("quad9", [[0, 3, 2, 1, 11, 10, 9, 8, 24], [1, 5, 4, 0, 17, 12, 16, 8, 22], [4, 5, 6, 7, 12, 13, 14, 15, 25],
+                               [3, 7, 6, 2, 19, 14, 18, 10, 23], [1, 2, 6, 5, 9, 18, 13, 17, 21], [0, 4, 7, 3, 16, 15, 19, 11, 20]]),
+}
+
+# connectivity hash -> boundary faces, the element connectivity of volumetric
+# simulations rarely changes, so the extracted surface can be reused across frames
+surface_cache = collections.OrderedDict()
+surface_cache_size = 8
+
+# values of a cell block that are hashed by cell_fingerprint, the others only go into a crc32
+fingerprint_samples = 4096
+
+def get_linear_type(cell_type):
+    return linear_cell_types.get(cell_type, cell_type)
+
+def is_volume_cell(cell: meshio.CellBlock):
+    return get_linear_type(cell.type) in volume_faces
+
+def is_ragged(data):
+    # meshio keeps polygons with different numbers of vertices as lists (or object arrays)
+    return not isinstance(data, np.ndarray) or data.dtype == object
+
+def get_polygon_loops(data):
+    '''
+    Returns the loop vertex indices and the number of loops per polygon of a polygon cell block
+    '''
+    if not is_ragged(data):
+        return data.ravel(), np.full(len(data), data.shape[1], dtype=np.int32)
+    loop_total = np.fromiter(map(len, data), dtype=np.int32, count=len(data))
+    if len(data) == 0:
+        return np.empty(0, dtype=np.int64), loop_total
+    return np.concatenate(data).astype(np.int64, copy=False), loop_total
+
+def update_fingerprint(h, data):
+    '''
+    Adds an index array to the hash h. A cryptographic hash of all the indices takes longer than reusing the
+    topology saves, so only a strided sample is hashed, together with the crc32 of all the indices.
+    '''
+    data = np.ascontiguousarray(data).reshape(-1)
+    h.update("{}{}".format(data.shape, data.dtype.str).encode())
+    h.update(np.ascontiguousarray(data[::max(1, len(data) // fingerprint_samples)]))
+    h.update(zlib.crc32(data).to_bytes(4, "little"))
+
+def cell_fingerprint(cell: meshio.CellBlock):
+    '''
+    Fingerprint of the connectivity of a cell block, see update_fingerprint
+    '''
+    h = hashlib.blake2b(digest_size=16)
+    if cell.type == "polygon" and is_ragged(cell.data):
+        arrays = get_polygon_loops(cell.data)
+    else:
+        arrays = (np.ascontiguousarray(cell.data),)
+    for data in arrays:
+        h.update("{}{}{}".format(cell.type, data.shape, data.dtype.str).encode())
+        if data.dtype == object:
+            # e.g. polyhedron cells, which are not supported anyway
+            h.update(repr(data.tolist()).encode())
+        else:
+            update_fingerprint(h, data)
+    return h.hexdigest()
+
+def get_cell_fingerprints(meshio_mesh):
+    '''
+    Fingerprints of all cell blocks, they are computed once per frame for the topology hash and the surface cache
+    '''
+    return [cell_fingerprint(cell) for cell in meshio_mesh.cells]
+
+def subdivide_faces(cell_type, data):
+    '''
+    Splits higher order faces into linear sub-faces, returns one array per number of face vertices
+    '''
+    return [np.concatenate([data[:, f] for f in faces]) for faces in subdivided_faces[cell_type].values()]
+
+def extract_surface(cells, subdivide=False):
+    '''
+    Boundary faces of all the volumetric cell blocks together, so that faces shared between
+    different blocks (e.g. tetra and wedge regions) are recognized as interior faces as well.
+    Higher order cells are culled by their corner nodes.
+    '''
+    surface = []
+    for width in (3, 4):
+        group = [cell for cell in cells if width in volume_faces[get_linear_type(cell.type)]]
+        if not group:
+            continue
+        local_faces = [np.array(volume_faces[get_linear_type(cell.type)][width]) for cell in group]
+        indices = boundary_face_indices([(cell.data, faces) for cell, faces in zip(group, local_faces)])
+        for cell, faces, (elem, local) in zip(group, local_faces, indices):
+            if len(elem) == 0:
+                continue
+            if subdivide and cell.type in higher_order_volume_faces:
+                face_type, faces = higher_order_volume_faces[cell.type]
+                surface.extend(subdivide_faces(face_type, cell.data[elem[:, None], np.array(faces)[local]]))
+            else:
+                surface.append(cell.data[elem[:, None], faces[local]])
+    return surface
+
+def extract_volume_faces(cells, subdivide=False, fingerprints=None):
+    '''
+    Boundary faces of the volumetric cells, see extract_surface. They are cached by the fingerprints of the cells,
+    which are computed if they aren't given
+    '''
+    if fingerprints is None:
+        fingerprints = [cell_fingerprint(cell) for cell in cells]
+    key = "".join(fingerprints) + str(subdivide)
+    surface = surface_cache.get(key)
+    if surface is None:
+        surface = extract_surface(cells, subdivide)
+        surface_cache[key] = surface
+        if len(surface_cache) > surface_cache_size:
+            surface_cache.popitem(last=False)
+    else:
+        surface_cache.move_to_end(key)
+    return surface
+
 def extract_faces(cell: meshio.CellBlock):
     if cell.type == "triangle":
         return cell.data.astype(np.uint64)
     elif cell.type == "triangle6":
-        pass
+        return cell.data[:, :3].astype(np.uint64)
     elif cell.type == "triangle7":
-        pass
+        return cell.data[:, :3].astype(np.uint64)
     elif cell.type == "quad":
         return cell.data.astype(np.uint64)
     elif cell.type == "quad8":
-        pass
+        return cell.data[:, :4].astype(np.uint64)
     elif cell.type == "quad9":
-        pass
-    elif cell.type == "tetra":
-        data = cell.data.astype(np.uint64)
-        faces = data[:, [0, 2, 1]]
-        faces = np.append(faces, data[:, [0, 3, 2]], axis=0)
-        faces = np.append(faces, data[:, [0, 1, 3]], axis=0)
-        faces = np.append(faces, data[:, [1, 2, 3]], axis=0)
-        faces_copy = np.copy(faces)
-        faces_copy.sort(axis=1)
-        _, indxs, count = np.unique(faces_copy, axis=0, return_index=True, return_counts=True)
-        faces = faces[indxs[count == 1]]
-        return faces
-    elif cell.type == "hexahedron":
-        data = cell.data.astype(np.uint64)
-        faces = data[:, [0, 3, 2, 1]]
-        faces = np.append(faces, data[:, [1, 5, 4, 0]], axis=0)
-        faces = np.append(faces, data[:, [4, 5, 6, 7]], axis=0)
-        faces = np.append(faces, data[:, [3, 7, 6, 2]], axis=0)
-        faces = np.append(faces, data[:, [1, 2, 6, 5]], axis=0)
-        faces = np.append(faces, data[:, [0, 4, 7, 3]], axis=0)
-        faces_copy = np.copy(faces)
-        faces_copy.sort(axis=1)
-        _, indxs, count = np.unique(faces_copy, axis=0, return_index=True, return_counts=True)
-        faces = faces[indxs[count == 1]]
-        return faces
+        return cell.data[:, :4].astype(np.uint64)
+    elif cell.type == "polygon":
+        if is_ragged(cell.data):
+            return get_polygon_loops(cell.data)
+        return cell.data.astype(np.uint64)
     elif cell.type == "vertex":
         return np.array([])
     elif cell.type == "line":
@@ -94,84 +231,176 @@ def apply_transformation(meshio_mesh, obj, depsgraph):
     obj.matrix_world = rigid_body_transformation @ eval_transform_matrix
 
 # function to create a single custom Blender mesh attribute
-def create_or_retrieve_attribute(mesh, k, v):
+def create_or_retrieve_attribute(mesh, k, v, domain="POINT"):
     if k not in mesh.attributes:
         if len(v) == 0:
-            return mesh.attributes.new(k, "FLOAT", "POINT")
+            return mesh.attributes.new(k, "FLOAT", domain)
         if len(v.shape) == 1:
             # one dimensional attribute
-            return mesh.attributes.new(k, "FLOAT", "POINT")
+            return mesh.attributes.new(k, "FLOAT", domain)
         if len(v.shape) == 2:
             dim = v.shape[1]
-            if dim > 3:
-                # show_message_box('higher than 3 dimensional attribue, ignored')
+            if dim > 4:
+                # show_message_box('higher than 4 dimensional attribue, ignored')
                 return None
             if dim == 1:
-                return mesh.attributes.new(k, "FLOAT", "POINT")
+                return mesh.attributes.new(k, "FLOAT", domain)
             if dim == 2:
-                return mesh.attributes.new(k, "FLOAT2", "POINT")
+                return mesh.attributes.new(k, "FLOAT2", domain)
             if dim == 3:
-                return mesh.attributes.new(k, "FLOAT_VECTOR", "POINT")
+                return mesh.attributes.new(k, "FLOAT_VECTOR", domain)
+            if dim == 4:
+                return mesh.attributes.new(k, "FLOAT_COLOR", domain)
         if len(v.shape) > 2:
             # show_message_box('more than 2 dimensional tensor, ignored')
             return None
     else:
         return mesh.attributes[k]
 
-def update_mesh(meshio_mesh, mesh):
-    # extract information from the meshio mesh
-    mesh_vertices = meshio_mesh.points
-
-    n_poly = 0
-    n_loop = 0
-    n_verts = len(mesh_vertices)
-    if n_verts == 0:
-        mesh.clear_geometry()
-        mesh.update()
-        mesh.validate()
-        return
-    edges = np.array([], dtype=np.uint64)
-    faces_loop_start = np.array([], dtype=np.uint64)
-    faces_loop_total = np.array([], dtype=np.uint64)
-    loops_vert_idx = np.array([], dtype=np.uint64)
-    shade_scheme = False
-    if mesh.polygons:
-        shade_scheme = mesh.polygons[0].use_smooth
-
+def topology_fingerprint(meshio_mesh, fingerprints=None):
+    '''
+    Hash of the number of points and all the cell blocks, i.e. everything that determines the connectivity.
+    fingerprints are the ones of get_cell_fingerprints, they are computed if they aren't given
+    '''
+    if fingerprints is None:
+        fingerprints = get_cell_fingerprints(meshio_mesh)
+    h = hashlib.blake2b(digest_size=16)
+    h.update(str(len(meshio_mesh.points)).encode())
+    for fingerprint in fingerprints:
+        h.update(fingerprint.encode())
+    return h.hexdigest()
+
+# reusable staging buffers for the index arrays, so they don't need to be allocated for every frame.
+# Blender stores vertex and loop indices as 32 bit integers, so that's what is passed to foreach_set
+staging_buffers = {}
+
+def get_staging_buffer(name, size, dtype=np.int32):
+    buffer = staging_buffers.get(name)
+    if buffer is None or len(buffer) < size or buffer.dtype != dtype:
+        # some headroom, so that slowly growing sequences don't reallocate every frame
+        buffer = np.empty(size + size // 4, dtype=dtype)
+        staging_buffers[name] = buffer
+    return buffer[:size]
+
+def get_face_loops(face_data):
+    '''
+    Face blocks are either n_faces x n_vertices arrays, or (loop vertex indices, loop totals) of ragged polygons.
+    Returns (loop vertex indices, loop total(s), number of faces) for both.
+    '''
+    if isinstance(face_data, tuple):
+        loops, loop_total = face_data
+        return loops, loop_total, len(loop_total)
+    return face_data.ravel(), face_data.shape[1], len(face_data)
+
+def build_geometry(face_blocks, edge_blocks):
+    '''
+    Assembles the edge and loop arrays of all cell blocks in two passes: the sizes are counted first,
+    then every block is written into its slice of the preallocated (staging) buffers
+    '''
+    face_blocks = [get_face_loops(face_data) for face_data in face_blocks]
+
+    n_edge = sum(len(edge_data) for edge_data in edge_blocks)
+    n_poly = sum(n for _, _, n in face_blocks)
+    n_loop = sum(len(loops) for loops, _, _ in face_blocks)
+
+    edges = get_staging_buffer("edges", 2 * n_edge)
+    loops_vert_idx = get_staging_buffer("loops_vert_idx", n_loop)
+    faces_loop_start = get_staging_buffer("faces_loop_start", n_poly)
+    faces_loop_total = get_staging_buffer("faces_loop_total", n_poly)
+
+    start = 0
+    for edge_data in edge_blocks:
+        edges[start:start + edge_data.size] = edge_data.ravel()
+        start += edge_data.size
+
+    loop = 0
+    poly = 0
+    for loops, loop_total, n in face_blocks:
+        loops_vert_idx[loop:loop + len(loops)] = loops
+        faces_loop_total[poly:poly + n] = loop_total
+        loop += len(loops)
+        poly += n
+
+    if n_poly > 0:
+        faces_loop_start[0] = 0
+        np.cumsum(faces_loop_total[:-1], dtype=np.int32, out=faces_loop_start[1:])
+    return edges, loops_vert_idx, faces_loop_start, faces_loop_total
+
+def get_geometry(meshio_mesh, subdivide=False, fingerprints=None):
+    '''
+    Returns the arrays of the Blender mesh of meshio_mesh as a dict with co, edges, loops, loop_start and loop_total.
+    The index arrays are staging buffers (see build_geometry), so they are only valid until the next call.
+    fingerprints are the ones of get_cell_fingerprints, if they have already been computed.
+    '''
+    # volumetric cells are handled all at once, see extract_surface
+    volume = [i for i, cell in enumerate(meshio_mesh.cells) if is_volume_cell(cell)]
+    surface_faces = []
+    if volume:
+        surface_faces = extract_volume_faces([meshio_mesh.cells[i] for i in volume], subdivide,
+                                             [fingerprints[i] for i in volume] if fingerprints is not None else None)
+
+    face_blocks = []
+    edge_blocks = []
     for cell in meshio_mesh.cells:
+        if is_volume_cell(cell):
+            continue
+        if subdivide and cell.type in subdivided_faces:
+            face_blocks.extend(subdivide_faces(cell.type, cell.data))
+            continue
         edge_data = extract_edges(cell)
         face_data = extract_faces(cell)
 
-        if edge_data.any():
-            edges = np.append(edges, edge_data)
+        if edge_data.ndim == 2 and len(edge_data) > 0:
+            edge_blocks.append(edge_data)
+        if isinstance(face_data, tuple):
+            if len(face_data[1]) > 0:
+                face_blocks.append(face_data)
+        elif face_data.ndim == 2 and len(face_data) > 0:
+            face_blocks.append(face_data)
+    face_blocks.extend(surface_faces)
+
+    edges, loops_vert_idx, faces_loop_start, faces_loop_total = build_geometry(face_blocks, edge_blocks)
+    return {
+        "co": meshio_mesh.points,
+        "edges": edges,
+        "loops": loops_vert_idx,
+        "loop_start": faces_loop_start,
+        "loop_total": faces_loop_total,
+    }
+
+def write_geometry(geometry, mesh):
+    '''
+    Writes the arrays of get_geometry into mesh, the mesh is only resized if the number of elements changes
+    '''
+    mesh_vertices = geometry["co"]
+    n_verts = len(mesh_vertices)
+    edges = geometry["edges"]
+    loops_vert_idx = geometry["loops"]
+    faces_loop_start = geometry["loop_start"]
+    faces_loop_total = geometry["loop_total"]
+    n_edge = len(edges) // 2
+    n_loop = len(loops_vert_idx)
+    n_poly = len(faces_loop_total)
 
-        if face_data.any():
-            n_poly += len(face_data)
-            n_loop += face_data.shape[0] * face_data.shape[1]
-            loops_vert_idx = np.append(loops_vert_idx, face_data.ravel())
-            faces_loop_total = np.append(faces_loop_total, np.ones((len(face_data)), dtype=np.uint64) * face_data.shape[1])
+    shade_scheme = False
+    if mesh.polygons:
+        shade_scheme = mesh.polygons[0].use_smooth
 
-    if faces_loop_total.size > 0:
-        faces_loop_start = np.cumsum(faces_loop_total)
-        # Add a zero as first entry
-        faces_loop_start = np.roll(faces_loop_start, 1)
-        faces_loop_start[0] = 0
-    
-    if len(mesh.vertices) == n_verts and len(mesh.polygons) == n_poly and len(mesh.loops) == n_loop:
+    if len(mesh.vertices) == n_verts and len(mesh.edges) == n_edge and len(mesh.polygons) == n_poly and len(mesh.loops) == n_loop:
         pass
     else:
         mesh.clear_geometry()
         mesh.vertices.add(n_verts)
-        mesh.edges.add(len(edge_data))
+        mesh.edges.add(n_edge)
         mesh.loops.add(n_loop)
         mesh.polygons.add(n_poly)
 
     mesh.vertices.foreach_set("co", mesh_vertices.ravel())
-    mesh.edges.foreach_set("vertices", edges)
+    mesh.edges.foreach_set("vertices", edges.ravel())
     mesh.loops.foreach_set("vertex_index", loops_vert_idx)
     mesh.polygons.foreach_set("loop_start", faces_loop_start)
     mesh.polygons.foreach_set("loop_total", faces_loop_total)
-    mesh.polygons.foreach_set("use_smooth", [shade_scheme] * len(faces_loop_total))
+    mesh.polygons.foreach_set("use_smooth", np.full(n_poly, shade_scheme, dtype=bool))
 
     # newer function but is about 4 times slower
     # mesh.clear_geometry()
@@ -180,6 +409,54 @@ def update_mesh(meshio_mesh, mesh):
     mesh.update()
     mesh.validate()
 
+def update_topology(meshio_mesh, mesh, fingerprints=None):
+    write_geometry(get_geometry(meshio_mesh, bpy.context.scene.BSEQ.subdivide_higher_order, fingerprints), mesh)
+
+def get_topology_hash(meshio_mesh, subdivide, fingerprints=None):
+    topology_hash = topology_fingerprint(meshio_mesh, fingerprints)
+    if subdivide:
+        # the same cells result in a different Blender mesh
+        topology_hash += "_subdivided"
+    return topology_hash
+
+def clear_mesh(mesh):
+    mesh.clear_geometry()
+    mesh.update()
+    mesh.validate()
+    mesh.BSEQ.topology_hash = ""
+
+def reuse_topology(mesh, topology_hash, mesh_vertices):
+    '''
+    Only updates the vertex positions if mesh already has the topology with topology_hash, returns whether it did
+    '''
+    if topology_hash and topology_hash == mesh.BSEQ.topology_hash and len(mesh.vertices) == len(mesh_vertices):
+        # same connectivity as the last frame, so only the positions (and the attributes) change
+        mesh.vertices.foreach_set("co", mesh_vertices.ravel())
+        mesh.update()
+        return True
+    return False
+
+def update_mesh(meshio_mesh, mesh):
+    mesh_vertices = meshio_mesh.points
+    n_verts = len(mesh_vertices)
+    if n_verts == 0:
+        clear_mesh(mesh)
+        return
+
+    topology_hash = ""
+    fingerprints = None
+    if bpy.context.scene.BSEQ.use_topology_cache:
+        # the fingerprints are also the key of the surface cache, so they are only computed once
+        fingerprints = get_cell_fingerprints(meshio_mesh)
+        topology_hash = get_topology_hash(meshio_mesh, bpy.context.scene.BSEQ.subdivide_higher_order, fingerprints)
+
+    if not reuse_topology(mesh, topology_hash, mesh_vertices):
+        update_topology(meshio_mesh, mesh, fingerprints)
+        mesh.BSEQ.topology_hash = topology_hash
+
+    update_attributes(meshio_mesh, mesh)
+
+def update_attributes(meshio_mesh, mesh):
     if bpy.context.scene.BSEQ.use_imported_normals:
         if "obj:vn" in meshio_mesh.point_data:
             mesh.BSEQ.split_norm_att_name = "bseq_obj:vn"
@@ -187,6 +464,8 @@ def update_mesh(meshio_mesh, mesh):
             mesh.BSEQ.split_norm_att_name = "bseq_normals"
         elif "obj:vn" in meshio_mesh.field_data and "obj:vn_face_idx" in meshio_mesh.cell_data:
             mesh.BSEQ.split_norm_att_name = "obj:vn"
+        elif "corner:normal" in meshio_mesh.field_data:
+            mesh.BSEQ.split_norm_att_name = "bseq_corner_normal"
 
     #  copy attributes
     for k, v in meshio_mesh.point_data.items():
@@ -197,6 +476,8 @@ def update_mesh(meshio_mesh, mesh):
         name_string = None
         if attribute.data_type == "FLOAT":
             name_string = "value"
+        elif attribute.data_type == "FLOAT_COLOR":
+            name_string = "color"
         else:
             name_string = 'vector'
 
@@ -212,15 +493,149 @@ def update_mesh(meshio_mesh, mesh):
             mesh.normals_split_custom_set_from_vertices(v)
 
     for k, v in meshio_mesh.field_data.items():
+        if k[:k.find(":") + 1] in field_domains:
+            # see update_domain_attributes
+            continue
         if k not in mesh.attributes:
             attribute = create_or_retrieve_attribute(mesh, k, [])
         
         # set split normal per loop per vertex
         if mesh.BSEQ.split_norm_att_name and mesh.BSEQ.split_norm_att_name == k:
             # Currently hard-coded for .obj files
+            corner_normals = get_corner_normals(meshio_mesh)
+            if corner_normals is not None and len(corner_normals) == len(mesh.loops):
+                if bpy.app.version < (4, 1, 0):
+                    mesh.use_auto_smooth = True
+                mesh.normals_split_custom_set(corner_normals)
+
+    update_domain_attributes(meshio_mesh, mesh)
+
+# field data prefix -> (attribute domain, mesh elements of the domain, attribute name prefix)
+field_domains = {
+    "corner:": ("CORNER", "loops", "bseq_corner_"),
+    "face:": ("FACE", "polygons", "bseq_face_"),
+}
+
+def update_domain_attributes(meshio_mesh, mesh):
+    '''
+    Face corner and face attributes are stored as field data "corner:<name>" and "face:<name>", with one value per
+    loop or face in the final order. Corner uv(w)s become a UV map, everything else a CORNER or FACE attribute
+    "bseq_corner_<name>" or "bseq_face_<name>".
+    '''
+    for k, v in meshio_mesh.field_data.items():
+        prefix = k[:k.find(":") + 1]
+        if prefix not in field_domains:
+            continue
+        domain, elements, attribute_prefix = field_domains[prefix]
+        if len(v) != len(getattr(mesh, elements)):
+            continue
+        name = k[len(prefix):]
+        if domain == "CORNER" and name in ("uv", "uvw"):
+            uv_layer = mesh.uv_layers.get("bseq_" + name)
+            if uv_layer is None:
+                uv_layer = mesh.uv_layers.new(name="bseq_" + name)
+            uv_layer.data.foreach_set("uv", np.ascontiguousarray(v[:, :2]).ravel())
+            continue
+
+        k = attribute_prefix + name
+        attribute = create_or_retrieve_attribute(mesh, k, v, domain)
+        if attribute is None:
+            continue
+        if attribute.data_type == "FLOAT":
+            name_string = "value"
+        elif attribute.data_type == "FLOAT_COLOR":
+            name_string = "color"
+        else:
+            name_string = "vector"
+        attribute.data.foreach_set(name_string, v.ravel())
+
+        # set as split normal per loop
+        if domain == "CORNER" and mesh.BSEQ.split_norm_att_name and mesh.BSEQ.split_norm_att_name == k:
+            if bpy.app.version < (4, 1, 0):
+                mesh.use_auto_smooth = True
+            mesh.normals_split_custom_set(v)
+
+def get_corner_normals(meshio_mesh):
+    '''
+    Returns the obj:vn normals of every loop as one n_loops x 3 float32 array, or None if the mesh has none
+    '''
+    if "obj:vn" not in meshio_mesh.field_data or "obj:vn_face_idx" not in meshio_mesh.cell_data:
+        return None
+    # the loops of all face blocks, in the order of the cells (see get_geometry)
+    indices = np.concatenate([np.asarray(data, dtype=np.int32).ravel() for data in meshio_mesh.cell_data["obj:vn_face_idx"]])
+    # obj indices start at 1
+    indices -= 1
+    # take is several times faster than indexing with an array along the first axis
+    return np.take(np.asarray(meshio_mesh.field_data["obj:vn"], dtype=np.float32), indices, axis=0)
+
+def get_bake_arrays(meshio_mesh, subdivide=False):
+    '''
+    Returns (arrays, meta) of the baked frame of meshio_mesh, see bake.py.
+    The index arrays are staging buffers, which the baker copies before they are reused.
+    '''
+    arrays = {"co": np.asarray(meshio_mesh.points, dtype=np.float32)}
+    meta = {"topology_hash": ""}
+    if len(meshio_mesh.points) > 0:
+        fingerprints = get_cell_fingerprints(meshio_mesh)
+        geometry = get_geometry(meshio_mesh, subdivide, fingerprints)
+        for k in ("edges", "loops", "loop_start", "loop_total"):
+            arrays[k] = geometry[k]
+        meta["topology_hash"] = get_topology_hash(meshio_mesh, subdivide, fingerprints)
+    for k, v in meshio_mesh.point_data.items():
+        if isinstance(v, np.ndarray) and v.dtype.kind in "biuf":
+            arrays["point:" + k] = v
+    for k, v in meshio_mesh.field_data.items():
+        # obj:vn is baked per loop below
+        if k != "obj:vn" and isinstance(v, np.ndarray) and v.dtype.kind in "biuf":
+            arrays["field:" + k] = v
+    corner_normals = get_corner_normals(meshio_mesh)
+    if corner_normals is not None:
+        arrays["corner_normals"] = corner_normals
+    return arrays, meta
+
+def get_arrays_topology_hash(arrays):
+    '''
+    Hash of the number of points and the loops of the arrays of an array reader, it's computed for every frame,
+    see update_fingerprint
+    '''
+    h = hashlib.blake2b(digest_size=16)
+    h.update(str(len(arrays["co"])).encode())
+    for k in ("edges", "loops", "loop_total"):
+        update_fingerprint(h, arrays[k])
+    return h.hexdigest()
+
+def update_mesh_from_arrays(arrays, mesh, topology_hash=""):
+    '''
+    Loads the arrays of a baked frame or of an array reader (see additional_file_formats) into mesh,
+    returns a meshio mesh with its points and data (but no cells)
+    '''
+    point_data = {k[len("point:"):]: v for k, v in arrays.items() if k.startswith("point:")}
+    field_data = {k[len("field:"):]: v for k, v in arrays.items() if k.startswith("field:")}
+    meshio_mesh = meshio.Mesh(arrays["co"], [], point_data=point_data, field_data=field_data)
+    if len(arrays["co"]) == 0:
+        clear_mesh(mesh)
+        return meshio_mesh
+
+    if not bpy.context.scene.BSEQ.use_topology_cache:
+        topology_hash = ""
+    if not reuse_topology(mesh, topology_hash, arrays["co"]):
+        write_geometry(arrays, mesh)
+        mesh.BSEQ.topology_hash = topology_hash
+
+    update_attributes(meshio_mesh, mesh)
+    if "corner_normals" in arrays and bpy.context.scene.BSEQ.use_imported_normals:
+        mesh.BSEQ.split_norm_att_name = "obj:vn"
+        if bpy.app.version < (4, 1, 0):
             mesh.use_auto_smooth = True
-            indices = [item for sublist in meshio_mesh.cell_data["obj:vn_face_idx"][0] for item in sublist]
-            mesh.normals_split_custom_set([meshio_mesh.field_data["obj:vn"][i - 1] for i in indices])
+        mesh.normals_split_custom_set(arrays["corner_normals"])
+    return meshio_mesh
+
+def update_mesh_from_bake(filepath, mesh):
+    '''
+    Loads the baked frame filepath into mesh, returns a meshio mesh with its points and data (but no cells)
+    '''
+    meta, arrays = read_frame(filepath)
+    return update_mesh_from_arrays(arrays, mesh, meta["topology_hash"])
 
 # function to create a single meshio object (not a sequence, this just inports some file using meshio)
 def create_meshio_obj(filepath):
@@ -281,12 +696,40 @@ def create_obj(fileseq, use_relative, root_path, transform_matrix=Matrix.Identit
     bpy.ops.object.select_all(action="DESELECT")
     bpy.context.view_layer.objects.active = object
 
+# True while a final render is running, renders always use the exact baked frames
+rendering = False
+
+@persistent
+def render_started(scene):
+    global rendering
+    rendering = True
+    if any(obj.BSEQ.init and obj.BSEQ.use_bake and obj.BSEQ.use_quantized for obj in bpy.data.objects):
+        # the current frame may show the quantized data
+        update_obj(scene, bpy.context.evaluated_depsgraph_get())
+
+@persistent
+def render_stopped(scene):
+    global rendering
+    rendering = False
+
+def script_namespace():
+    '''
+    Returns the names available to custom scripts by default
+    '''
+    return {"bpy": bpy, "meshio": meshio, "fileseq": fileseq, "np": np, "numpy": np, "update_mesh": update_mesh}
+
+
 def update_obj(scene, depsgraph=None):
+    # files that are read ahead for any sequence during this frame change
+    prefetch_paths = set()
+    # objects whose frame index is still needed
+    sequence_names = set()
     for obj in bpy.data.objects:
         start_time = time.perf_counter()
 
         if obj.BSEQ.init == False:
             continue
+        sequence_names.add(obj.name_full)
         if obj.BSEQ.enabled == False:
             continue
         if obj.mode != "OBJECT":
@@ -299,33 +742,32 @@ def update_obj(scene, depsgraph=None):
             current_frame = obj.BSEQ.frame
         meshio_mesh = None
         
-        # in case the blender file was created on windows system, but opened in linux system
-        full_path = get_absolute_path(obj, scene)
+        frame_index = get_frame_index(obj, scene)
+        fs = frame_index.fs
 
-        fs = fileseq.FileSequence(full_path)
-        
+        user_process = None
+        user_preprocess = None
         if obj.BSEQ.use_advance and obj.BSEQ.script_name:
             script = bpy.data.texts[obj.BSEQ.script_name]
             try:
-                exec(script.as_string())
+                module = get_script_module(script, script_namespace())
             except Exception as e:
                 show_message_box(traceback.format_exc(), "running script: " + obj.BSEQ.script_name + " failed: " + str(e),
                                  "ERROR")
                 continue
+            user_process = getattr(module, "process", None)
+            user_preprocess = getattr(module, "preprocess", None)
 
-        if 'process' in locals():
-            user_process = locals()['process']
+        if user_process is not None:
             try:
                 user_process(fs, current_frame, obj.data)
                 obj.BSEQ.current_file = "Controlled by user process"
             except Exception as e:
                 show_message_box("Error when calling user process: " + traceback.format_exc(), icon="ERROR")
-            del locals()['process']
             # this continue means if process exist, all the remaining code will be ignored, whethere or not error occurs
             continue
 
-        elif 'preprocess' in locals():
-            user_preprocess = locals()['preprocess']
+        elif user_preprocess is not None:
             try:
                 meshio_mesh = user_preprocess(fs, current_frame)
                 obj.BSEQ.current_file = "Controlled by user preprocess"
@@ -333,21 +775,53 @@ def update_obj(scene, depsgraph=None):
                 show_message_box("Error when calling user preprocess: " + traceback.format_exc(), icon="ERROR")
                 # this continue means only if error occures, then goes to next bpy.object
                 continue
-            finally:
-                del locals()['preprocess']
-        else:
-            if obj.BSEQ.match_frames:
-                fs_frames = fs.frameSet()
-                if current_frame in fs_frames:
-                    filepath = fs[fs_frames.index(current_frame)]
-                    filepath = os.path.normpath(filepath)
-                    meshio_mesh = load_meshio_from_path(fs, filepath, obj)
-                else:
-                    meshio_mesh = meshio.Mesh([], [])
+        elif obj.BSEQ.use_bake and obj.BSEQ.bake_path:
+            filepath = frame_index.get_filepath(current_frame, obj.BSEQ.match_frames)
+            if filepath is None:
+                meshio_mesh = meshio.Mesh([], [])
             else:
-                filepath = fs[current_frame % len(fs)]
-                filepath = os.path.normpath(filepath)
+                bake_dir = convert_to_absolute_path(obj.BSEQ.bake_path, scene.BSEQ.root_path)
+                bake_filepath = get_bake_path(bake_dir, filepath)
+                if obj.BSEQ.use_quantized and not rendering:
+                    quantized_filepath = get_bake_path(bake_dir, filepath, quantized=True)
+                    if os.path.exists(quantized_filepath):
+                        bake_filepath = quantized_filepath
+                try:
+                    meshio_mesh = update_mesh_from_bake(bake_filepath, obj.data)
+                    obj.BSEQ.current_file = bake_filepath
+                except Exception as e:
+                    show_message_box("Error when reading: " + bake_filepath + ",\n" + traceback.format_exc(),
+                                     "Baked Frame Loading Error" + str(e),
+                                     icon="ERROR")
+                    continue
+                # the mesh has already been updated from the baked arrays
+                apply_transformation(meshio_mesh, obj, depsgraph)
+                obj.BSEQ.last_benchmark = (time.perf_counter() - start_time) * 1000
+                continue
+        else:
+            if scene.BSEQ.use_prefetch:
+                paths = frame_index.get_next_filepaths(current_frame, obj.BSEQ.prefetch_depth, obj.BSEQ.match_frames)
+                if scene.BSEQ.use_frame_cache:
+                    # frames that are still cached don't need to be read again
+                    cache = get_cache(scene)
+                    paths = [p for p in paths if p not in cache]
+                prefetch.schedule(paths, obj.BSEQ.use_parallel_parse)
+                prefetch_paths.update(paths)
+
+            filepath = frame_index.get_filepath(current_frame, obj.BSEQ.match_frames)
+            if filepath is not None:
                 meshio_mesh = load_meshio_from_path(fs, filepath, obj)
+                if meshio_mesh is None:
+                    # keep showing the previous frame
+                    continue
+                if isinstance(meshio_mesh, dict):
+                    # the arrays of the Blender mesh from an array reader, no meshio mesh to translate
+                    meshio_mesh = update_mesh_from_arrays(meshio_mesh, obj.data, get_arrays_topology_hash(meshio_mesh))
+                    apply_transformation(meshio_mesh, obj, depsgraph)
+                    obj.BSEQ.last_benchmark = (time.perf_counter() - start_time) * 1000
+                    continue
+            else:
+                meshio_mesh = meshio.Mesh([], [])
 
         if not isinstance(meshio_mesh, meshio.Mesh):
             show_message_box('function preprocess does not return meshio object', "ERROR")
@@ -358,3 +832,7 @@ def update_obj(scene, depsgraph=None):
 
         end_time = time.perf_counter()
         obj.BSEQ.last_benchmark = (end_time - start_time) * 1000
+
+    # drop read-aheads that are no longer needed, e.g. after jumping in the timeline
+    prefetch.discard(prefetch_paths)
+    discard_frame_indices(sequence_names)
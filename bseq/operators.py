@@ -3,8 +3,11 @@ from mathutils import Matrix
 import fileseq
 from .messenger import *
 import traceback
-from .utils import refresh_obj, show_message_box, get_relative_path
-from .importer import create_obj, create_meshio_obj
+from .utils import refresh_obj, show_message_box, get_relative_path, convert_to_absolute_path
+from .importer import create_obj, create_meshio_obj, get_bake_arrays
+from .frames import get_frame_index
+from .bake import get_bake_path, Baker, delta_key_interval
+from .cache import get_cache
 import numpy as np
 import os
 
@@ -290,6 +293,57 @@ class BSEQ_OT_refresh_seq(bpy.types.Operator):
 
         return {"FINISHED"}
 
+class BSEQ_OT_bake(bpy.types.Operator):
+    '''Convert all frames of the selected sequence into the baked cache'''
+    bl_label = "Bake frames"
+    bl_idname = "bseq.bake"
+
+    def execute(self, context):
+        scene = context.scene
+        obj = bpy.data.objects[scene.BSEQ.selected_obj_num]
+        if not obj.BSEQ.bake_path:
+            show_message_box("Please set the bake directory of the sequence", icon="ERROR")
+            return {"CANCELLED"}
+        if obj.BSEQ.bake_path.startswith("//") and not bpy.data.is_saved:
+            return relative_path_error()
+        bake_dir = convert_to_absolute_path(obj.BSEQ.bake_path, scene.BSEQ.root_path)
+        os.makedirs(bake_dir, exist_ok=True)
+
+        frame_index = get_frame_index(obj, scene)
+        baker = Baker(delta_key_interval if obj.BSEQ.bake_deltas else 0)
+        quantized_baker = Baker(quantized=True) if obj.BSEQ.use_quantized else None
+        wm = context.window_manager
+        wm.progress_begin(0, len(frame_index))
+        try:
+            for i in range(len(frame_index)):
+                filepath = frame_index.get_path(i)
+                try:
+                    meshio_mesh = meshio.read(filepath)
+                    arrays, meta = get_bake_arrays(meshio_mesh, scene.BSEQ.subdivide_higher_order)
+                    bake_filepath = get_bake_path(bake_dir, filepath)
+                    baker.write(bake_filepath, arrays, meta)
+                    if quantized_baker is not None:
+                        quantized_baker.write(get_bake_path(bake_dir, filepath, quantized=True), arrays, meta, bake_filepath)
+                except Exception as e:
+                    show_message_box("Error when baking: " + filepath + ",\n" + traceback.format_exc(),
+                                     "Bake Error" + str(e),
+                                     icon="ERROR")
+                    return {"CANCELLED"}
+                wm.progress_update(i + 1)
+        finally:
+            wm.progress_end()
+        obj.BSEQ.use_bake = True
+        return {"FINISHED"}
+
+class BSEQ_OT_clear_cache(bpy.types.Operator):
+    '''Remove all cached frames from memory'''
+    bl_label = "Clear frame cache"
+    bl_idname = "bseq.clearcache"
+
+    def execute(self, context):
+        get_cache(context.scene).clear()
+        return {"FINISHED"}
+
 class BSEQ_OT_disable_all(bpy.types.Operator):
     '''Deactivate all sequences'''
     bl_label = "Deactivate all sequences"
@@ -1,5 +1,6 @@
 import bpy
 import os
+from .cache import get_cache
 
 
 class BSEQ_UL_Obj_List(bpy.types.UIList):
@@ -93,6 +94,19 @@ class BSEQ_Globals_Panel(BSEQ_Panel, bpy.types.Panel):
         col2.prop(sim_loader, "auto_refresh_active", text="")
         col1.label(text="Auto Refresh All")
         col2.prop(sim_loader, "auto_refresh_all", text="")
+        col1.label(text="Reuse Topology")
+        col2.prop(sim_loader, "use_topology_cache", text="")
+        col1.label(text="Prefetch Frames")
+        col2.prop(sim_loader, "use_prefetch", text="")
+        col1.label(text="Cache Frames")
+        col2.prop(sim_loader, "use_frame_cache", text="")
+        if sim_loader.use_frame_cache:
+            col1.label(text="Cache Size (MB)")
+            col2.prop(sim_loader, "frame_cache_size", text="")
+            cache = get_cache(context.scene)
+            col1.label(text="Cache Used")
+            col2.label(text="{:.1f} / {:.1f} MB ({} frames)".format(cache.used / 1024**2, cache.budget / 1024**2, len(cache)))
+            layout.operator("bseq.clearcache", text="Clear Cache")
 
 class BSEQ_Advanced_Panel(BSEQ_Panel, bpy.types.Panel):
     bl_label = "Advanced Settings"
@@ -201,6 +215,31 @@ class BSEQ_Settings(BSEQ_Panel, bpy.types.Panel):
         row2 = col2.row()
         row2.enabled = False
         row2.prop(obj.BSEQ, 'last_benchmark', text="", )
+        col1.label(text='Prefetch depth')
+        col2.prop(obj.BSEQ, 'prefetch_depth', text="")
+        col1.label(text='Parallel Parsing')
+        col2.prop(obj.BSEQ, 'use_parallel_parse', text="")
+        col1.label(text='Prefetch hits / misses')
+        row3 = col2.row()
+        row3.enabled = False
+        row3.prop(obj.BSEQ, 'prefetch_hits', text="")
+        row3.prop(obj.BSEQ, 'prefetch_misses', text="")
+        col1.label(text='Bake Directory')
+        col2.prop(obj.BSEQ, 'bake_path', text="")
+        col1.label(text='Play Baked Frames')
+        col2.prop(obj.BSEQ, 'use_bake', text="")
+        col1.label(text='Delta Positions')
+        col2.prop(obj.BSEQ, 'bake_deltas', text="")
+        col1.label(text='Quantized Viewport')
+        col2.prop(obj.BSEQ, 'use_quantized', text="")
+        col1.label(text='Follow Tail')
+        col2.prop(obj.BSEQ, 'tail_follow', text="")
+        if obj.BSEQ.tail_follow:
+            col1.label(text='Pin Playhead')
+            col2.prop(obj.BSEQ, 'tail_pin_playhead', text="")
+            col1.label(text='Lock Suffix')
+            col2.prop(obj.BSEQ, 'tail_lock_suffix', text="")
+        layout.operator("bseq.bake", text="Bake Frames")
 
         # attributes settings
         layout.label(text="Attributes")
@@ -244,6 +283,9 @@ class BSEQ_PT_Import(BSEQ_Panel, bpy.types.Panel):
         col1.label(text="Import Normals")
         col2.prop(importer_prop, "use_imported_normals", text="")
 
+        col1.label(text="Subdivide Higher Order")
+        col2.prop(importer_prop, "subdivide_higher_order", text="")
+
         col1.label(text="Custom Transform")
         col2.prop(importer_prop, "use_custom_transform", text="")
 
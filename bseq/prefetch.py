@@ -0,0 +1,56 @@
+import concurrent.futures
+import os
+import additional_file_formats
+
+#  Read-ahead of upcoming frames. Files are parsed in a thread pool while the current frame is
+#  being displayed, so that update_obj only has to upload the data once the playhead arrives.
+#  Everything here is called from the main thread, the worker threads only read files (see
+#  additional_file_formats.read) and must never touch bpy.
+
+max_workers = max(1, min(8, os.cpu_count() or 1))
+
+_executor = None
+# filepath -> concurrent.futures.Future
+_futures = {}
+
+
+def get_executor():
+    global _executor
+    if _executor is None:
+        _executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bseq_prefetch")
+    return _executor
+
+
+def schedule(filepaths, parallel=False):
+    '''
+    Start reading the given files in the background, unless they are already queued.
+    If parallel, large files are parsed in several processes (see additional_file_formats.read)
+    '''
+    for filepath in filepaths:
+        if filepath not in _futures:
+            _futures[filepath] = get_executor().submit(additional_file_formats.read, filepath, parallel)
+
+
+def take(filepath):
+    '''
+    Remove and return the pending read of filepath, or None if it has not been prefetched
+    '''
+    return _futures.pop(filepath, None)
+
+
+def discard(keep):
+    '''
+    Cancel all pending reads whose filepath is not in keep
+    '''
+    for filepath in list(_futures):
+        if filepath not in keep:
+            _futures.pop(filepath).cancel()
+
+
+def shutdown():
+    global _executor
+    discard(())
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+        _executor = None
+
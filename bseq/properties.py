@@ -19,6 +19,16 @@ class BSEQ_scene_property(bpy.types.PropertyGroup):
                                                 default=False,
                                                 )
 
+    use_topology_cache: bpy.props.BoolProperty(name='Reuse Topology',
+                                               description="Only update positions and attributes if the connectivity is the same as in the previous frame",
+                                               default=True,
+                                               )
+
+    subdivide_higher_order: bpy.props.BoolProperty(name='Subdivide Higher Order Cells',
+                                                   description="Split quadratic cells (e.g. triangle6, quad9, tetra10) into linear faces using their midside nodes, instead of using only their corner nodes",
+                                                   default=False,
+                                                   )
+
     root_path: bpy.props.StringProperty(name="Root Directory",
                                         subtype="DIR_PATH",
                                         description="Select root folder for all relative paths. If empty, root is folder of the Blender file",
@@ -77,6 +87,22 @@ class BSEQ_scene_property(bpy.types.PropertyGroup):
                                          description="Auto refresh all sequences every frame",
                                          default=False,
                                          )
+
+    use_prefetch: bpy.props.BoolProperty(name='Prefetch Frames',
+                                         description="Read the upcoming frames of all active sequences in the background",
+                                         default=False,
+                                         )
+
+    use_frame_cache: bpy.props.BoolProperty(name='Cache Frames',
+                                            description="Keep recently loaded frames in memory, so that revisiting them does not read the files again",
+                                            default=False,
+                                            )
+
+    frame_cache_size: bpy.props.IntProperty(name='Cache Size (MB)',
+                                            description="Memory budget of the frame cache in megabytes. Least recently used frames are evicted first",
+                                            default=1024,
+                                            min=1,
+                                            )
         
     use_custom_transform: bpy.props.BoolProperty(name='Custom Transform', 
                                                  description="Use a custom transformation matrix when importing", 
@@ -130,7 +156,53 @@ class BSEQ_obj_property(bpy.types.PropertyGroup):
                                          description="Show only frames that match the current frame number",
                                          )
     last_benchmark: bpy.props.FloatProperty(name="Last loading time")
+    prefetch_depth: bpy.props.IntProperty(name="Prefetch depth",
+                                          description="Number of upcoming frames read in the background, if prefetching is enabled",
+                                          default=2,
+                                          min=0,
+                                          soft_max=16,
+                                          )
+    use_parallel_parse: bpy.props.BoolProperty(name="Parallel Parsing",
+                                               description="Parse files of this sequence of 16 MiB or more in several "
+                                               "processes, currently only .obj files",
+                                               default=False,
+                                               )
+    prefetch_hits: bpy.props.IntProperty(name="Prefetch hits",
+                                         description="Number of frames that had already been prefetched when needed")
+    prefetch_misses: bpy.props.IntProperty(name="Prefetch misses",
+                                           description="Number of frames that had to be read on demand")
+    use_bake: bpy.props.BoolProperty(name="Play Baked Frames",
+                                     description="Load the frames from the baked cache instead of reading the original files",
+                                     default=False,
+                                     )
+    bake_path: bpy.props.StringProperty(name="Bake Directory",
+                                        description="Directory of the baked frames of this sequence",
+                                        subtype="DIR_PATH",
+                                        )
+    bake_deltas: bpy.props.BoolProperty(name="Delta Positions",
+                                        description="Store the baked positions losslessly compressed as the difference to a key frame. Smaller, but slower to load",
+                                        default=False,
+                                        )
+    use_quantized: bpy.props.BoolProperty(name="Quantized Viewport",
+                                          description="Also bake a lossy copy with 16 bit positions and 8 bit attributes, and show it in the viewport. Renders always use the exact frames",
+                                          default=False,
+                                          )
+    tail_follow: bpy.props.BoolProperty(name="Follow Tail",
+                                        description="Extend the sequence with new frames while they are written by a running simulation, but only once they are complete",
+                                        default=False,
+                                        )
+    tail_pin_playhead: bpy.props.BoolProperty(name="Pin Playhead",
+                                              description="Jump to the newest complete frame whenever one appears",
+                                              default=False,
+                                              )
+    tail_lock_suffix: bpy.props.StringProperty(name="Lock Suffix",
+                                               description="A frame is still being written as long as a file with this suffix appended to its name exists",
+                                               default=".lock",
+                                               )
 
 # set this property for mesh, not object (maybe change later?)
 class BSEQ_mesh_property(bpy.types.PropertyGroup):
     split_norm_att_name: bpy.props.StringProperty(default="")
+    topology_hash: bpy.props.StringProperty(default="",
+                                            description="Fingerprint of the connectivity that was loaded last",
+                                            )
@@ -0,0 +1,37 @@
+import hashlib
+import types
+
+#  Registry of the compiled per-object scripts (see docs/script.md). Every Blender text is compiled
+#  once into its own module namespace, and only compiled again when its content changes.
+#  Objects that use the same script share the module.
+
+# content hash -> module
+_modules = {}
+# text name -> content hash of the last compiled version
+_hashes = {}
+
+
+def get_script_module(text, namespace):
+    '''
+    Returns the module of the compiled text, namespace holds the names available to the script by default
+    '''
+    source = text.as_string()
+    digest = hashlib.blake2b(source.encode(), digest_size=16).hexdigest()
+    module = _modules.get(digest)
+    if module is None:
+        module = types.ModuleType("bseq_script_" + digest)
+        module.__dict__.update(namespace)
+        exec(compile(source, text.name, "exec"), module.__dict__)
+        _modules[digest] = module
+
+    # drop the previous version of an edited script
+    old_digest = _hashes.get(text.name)
+    _hashes[text.name] = digest
+    if old_digest is not None and old_digest not in _hashes.values():
+        _modules.pop(old_digest, None)
+    return module
+
+
+def clear_scripts():
+    _modules.clear()
+    _hashes.clear()
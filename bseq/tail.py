@@ -0,0 +1,140 @@
+import os
+import time
+import traceback
+import bpy
+import fileseq
+from .frames import get_frame_index
+from .utils import set_obj_sequence
+from .watcher import scan_frames, is_unchanged
+
+#  Tail-follow mode for sequences that are still being written by a running simulation. A timer
+#  polls the directories of these sequences and only adds a new frame once its file is complete,
+#  i.e. its size and modification time did not change between two polls and there is no lock file
+#  next to it. The directory is only listed when its mtime changes (or may have changed unnoticed, see
+#  watcher.is_unchanged), between listings only the pending files are stat'ed, so a poll is cheap
+#  enough to run in the UI thread.
+
+# seconds between two polls
+poll_interval = 0.5
+
+
+class TailState:
+    '''
+    Files of a followed sequence that have appeared but are not complete yet
+    '''
+
+    def __init__(self, key, mtime):
+        # (directory, basename, extension) of the sequence
+        self.key = key
+        self.mtime = mtime
+        # time.time() when the directory was listed
+        self.scan_time = 0.0
+        # frame -> (size, mtime) of the file at the last poll
+        self.pending = {}
+
+
+# object name -> TailState
+_states = {}
+# object name -> last error of following it, which is only printed once until it changes
+_errors = {}
+
+
+def is_complete(filepath, last_stat, lock_suffix):
+    '''
+    Returns (complete, stat) of the file, where stat is compared to the one of the next poll
+    '''
+    if lock_suffix and os.path.exists(filepath + lock_suffix):
+        return False, None
+    try:
+        stat = os.stat(filepath)
+    except OSError:
+        return False, None
+    stat = (stat.st_size, stat.st_mtime_ns)
+    return stat[0] > 0 and stat == last_stat, stat
+
+
+def follow_obj(obj, scene):
+    '''
+    Adds the newly completed frames to the sequence of obj, returns the newest added frame or None
+    '''
+    frame_index = get_frame_index(obj, scene)
+    if frame_index.frameless:
+        # a single file, no new frames can appear
+        return None
+    fs = frame_index.fs
+    dirname = fs.dirname() or os.curdir
+    try:
+        mtime = os.stat(dirname).st_mtime_ns
+    except OSError:
+        return None
+    key = (dirname, fs.basename(), fs.extension())
+    known = frame_index.indices.keys()
+
+    state = _states.get(obj.name_full)
+    if state is None or state.key != key:
+        state = _states[obj.name_full] = TailState(key, None)
+    removed = set()
+    if not is_unchanged(mtime, state.mtime, state.scan_time):
+        state.mtime = mtime
+        state.scan_time = time.time()
+        frames = scan_frames(dirname, fs.basename(), fs.extension())
+        removed = set(known) - frames
+        for f in frames.difference(known):
+            state.pending.setdefault(f, None)
+        for f in list(state.pending):
+            if f not in frames:
+                del state.pending[f]
+
+    complete = []
+    for f, last_stat in list(state.pending.items()):
+        done, state.pending[f] = is_complete(fs.frame(f), last_stat, obj.BSEQ.tail_lock_suffix)
+        if done:
+            complete.append(f)
+            del state.pending[f]
+
+    if not complete and not removed:
+        return None
+    frames = (set(known) - removed).union(complete)
+    if not frames:
+        return None
+    fs = fs.copy()
+    fs.setFrameSet(fileseq.FrameSet(sorted(frames)))
+    set_obj_sequence(obj, scene, fs)
+    return max(complete) if complete else None
+
+
+def poll_tail():
+    scene = bpy.context.scene
+    for obj in bpy.data.objects:
+        if obj.BSEQ.init == False or obj.BSEQ.enabled == False or obj.BSEQ.tail_follow == False:
+            continue
+        # an exception would unregister the timer, and with it tail-follow for all sequences
+        try:
+            newest = follow_obj(obj, scene)
+            if newest is not None and obj.BSEQ.tail_pin_playhead:
+                if obj.BSEQ.match_frames:
+                    scene.frame_set(newest)
+                else:
+                    scene.frame_set(len(get_frame_index(obj, scene)) - 1)
+        except Exception:
+            error = traceback.format_exc()
+            if _errors.get(obj.name_full) != error:
+                _errors[obj.name_full] = error
+                # timers run without a screen, and tail-follow must not stop the animation,
+                # so no message box (see load_meshio_from_path)
+                print("Error when following: " + obj.name_full + ",\n" + error)
+            continue
+        _errors.pop(obj.name_full, None)
+    return poll_interval
+
+
+def register_tail():
+    if not bpy.app.timers.is_registered(poll_tail):
+        bpy.app.timers.register(poll_tail, first_interval=poll_interval, persistent=True)
+
+
+def unregister_tail():
+    if bpy.app.timers.is_registered(poll_tail):
+        bpy.app.timers.unregister(poll_tail)
+    _states.clear()
+    _errors.clear()
@@ -3,6 +3,9 @@ import fileseq
 import os
 import meshio
 import traceback
+import additional_file_formats
+from . import prefetch
+from .cache import get_cache
 
 def show_message_box(message="", title="Message Box", icon="INFO"):
     '''
@@ -48,12 +51,11 @@ def get_absolute_path(obj, scene):
     return full_path
 
 
-def refresh_obj(obj, scene):
+def set_obj_sequence(obj, scene, fs):
+    '''
+    Points obj to the file sequence fs, keeping the path relative if it was relative before
+    '''
     is_relative = obj.BSEQ.path.startswith("//")
-    print("is_relative: ", is_relative)
-    fs = get_absolute_path(obj, scene)
-    fs = fileseq.findSequenceOnDisk(fs)
-    fs = fileseq.findSequenceOnDisk(fs.dirname() + fs.basename() + "@" + fs.extension())
     obj.BSEQ.start_end_frame = (fs.start(), fs.end())
     fs = str(fs)
     if is_relative:
@@ -61,12 +63,46 @@ def refresh_obj(obj, scene):
     obj.BSEQ.path = os.path.dirname(fs)
     obj.BSEQ.pattern = os.path.basename(fs)
 
+def refresh_obj(obj, scene):
+    fs = get_absolute_path(obj, scene)
+    fs = fileseq.findSequenceOnDisk(fs)
+    fs = fileseq.findSequenceOnDisk(fs.dirname() + fs.basename() + "@" + fs.extension())
+    set_obj_sequence(obj, scene, fs)
+
 def load_meshio_from_path(fileseq, filepath, obj = None):
+    '''
+    Returns the meshio mesh of filepath, or the arrays of the Blender mesh (a dict) if its format has an array reader
+    '''
+    cache = None
+    if bpy.context.scene.BSEQ.use_frame_cache:
+        cache = get_cache(bpy.context.scene)
+        meshio_mesh = cache.get(filepath)
+        if meshio_mesh is not None:
+            if obj is not None:
+                obj.BSEQ.current_file = filepath
+            return meshio_mesh
+
+    # use the background read if this frame has been prefetched
+    future = prefetch.take(filepath)
+    if obj is not None and obj.BSEQ.prefetch_depth > 0 and bpy.context.scene.BSEQ.use_prefetch:
+        if future is not None:
+            obj.BSEQ.prefetch_hits += 1
+        else:
+            obj.BSEQ.prefetch_misses += 1
     try:
-        meshio_mesh = meshio.read(filepath)
+        if future is not None:
+            meshio_mesh = future.result()
+        else:
+            meshio_mesh = additional_file_formats.read(filepath, obj is not None and obj.BSEQ.use_parallel_parse)
+        if cache is not None:
+            cache.put(filepath, meshio_mesh)
         if obj is not None:
             obj.BSEQ.current_file = filepath
     except Exception as e:
+        if obj is not None and obj.BSEQ.tail_follow:
+            # the file may be rewritten by the running simulation, don't interrupt the animation
+            print("Error when reading: " + filepath + ",\n" + traceback.format_exc())
+            return None
         show_message_box("Error when reading: " + filepath + ",\n" + traceback.format_exc(),
                         "Meshio Loading Error" + str(e),
                         icon="ERROR")
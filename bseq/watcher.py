@@ -0,0 +1,108 @@
+import os
+import re
+import time
+import fileseq
+from .frames import get_frame_index
+from .utils import refresh_obj, set_obj_sequence
+
+#  Incremental auto refresh. Instead of searching the whole directory for the sequence on every
+#  frame change, only the modification time of the directory is checked, which changes whenever
+#  files are added, removed or renamed. The directory is only listed again when it has changed, or
+#  when the last listing was too close to its mtime to trust it, and new files extend the sequence
+#  in place. The python standard library has no portable file
+#  system notifications (e.g. inotify), so polling the directory mtime is used everywhere.
+
+
+class WatchState:
+    '''
+    What is known about the directory of a sequence since it was last listed
+    '''
+
+    def __init__(self, key, mtime, scan_time):
+        # (directory, basename, extension) of the sequence
+        self.key = key
+        self.mtime = mtime
+        # time.time() when the directory was listed
+        self.scan_time = scan_time
+
+
+def is_unchanged(mtime, last_mtime, scan_time):
+    '''
+    Returns whether a directory with mtime (in ns) can't have changed since it was listed at scan_time,
+    when its mtime was last_mtime
+    '''
+    return mtime == last_mtime and scan_time - mtime / 1e9 >= mtime_window
+
+
+# object name -> WatchState
+_states = {}
+
+# seconds during which the mtime of a directory is not trusted after a listing. Files created in the same
+# timestamp tick as the listing don't change the mtime, e.g. on file systems with coarse timestamps, and
+# NFS clients may report a cached mtime for a while.
+mtime_window = 2.0
+
+
+def get_frame_regex(basename, extension):
+    return re.compile(re.escape(basename) + r"(-?\d+)" + re.escape(extension) + "$")
+
+
+def scan_frames(dirname, basename, extension):
+    '''
+    Returns the frame numbers of all files in dirname that belong to the sequence
+    '''
+    regex = get_frame_regex(basename, extension)
+    frames = set()
+    with os.scandir(dirname) as entries:
+        for entry in entries:
+            name = entry.name
+            # cheap test first, most files of a large directory don't belong to this sequence
+            if not name.startswith(basename) or not name.endswith(extension):
+                continue
+            m = regex.match(name)
+            if m is not None:
+                frames.add(int(m.group(1)))
+    return frames
+
+
+def refresh_if_changed(obj, scene):
+    '''
+    Updates the sequence of obj if files have appeared in or disappeared from its directory
+    '''
+    if obj.BSEQ.tail_follow:
+        # new files may still be incomplete, they are added by the tail-follow timer instead
+        return
+    frame_index = get_frame_index(obj, scene)
+    if frame_index.frameless:
+        # a single file, there are no other frames to find
+        return
+    fs = frame_index.fs
+    dirname = fs.dirname() or os.curdir
+    try:
+        mtime = os.stat(dirname).st_mtime_ns
+    except OSError:
+        return
+    key = (dirname, fs.basename(), fs.extension())
+    state = _states.get(obj.name_full)
+    if state is not None and state.key == key and is_unchanged(mtime, state.mtime, state.scan_time):
+        return
+
+    # taken before the listing, files that are added during it are found by the next one
+    scan_time = time.time()
+    frames = scan_frames(dirname, fs.basename(), fs.extension())
+    known = frame_index.indices.keys()
+    if not frames:
+        # nothing left to show, keep the sequence as it is
+        pass
+    elif not known <= frames:
+        # files have been removed, let fileseq find the sequence again
+        refresh_obj(obj, scene)
+    elif len(frames) != len(known):
+        fs = fs.copy()
+        fs.setFrameSet(fileseq.FrameSet(sorted(frames)))
+        set_obj_sequence(obj, scene, fs)
+    _states[obj.name_full] = WatchState(key, mtime, scan_time)
+
+
+def clear_watch_states():
+    _states.clear()
@@ -0,0 +1,77 @@
+"""
+Measures the throughput of the obj readers of additional_file_formats.obj in MB/s:
+
+    python tests/benchmark_obj.py [--size MB] [--workers N] [--repeat N] [file.obj]
+
+Without a file, a mesh of quads with uvs and normals of about --size MB is written to a temporary file.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import conftest  # noqa: F401, adds the paths of the addon
+
+from additional_file_formats import obj
+
+
+def write_obj(filename, size):
+    """Writes a grid of quads with uvs and normals, about 130 bytes per vertex."""
+    n = max(2, int(np.sqrt(size * 1024 * 1024 / 130)))
+    x, y = np.meshgrid(np.linspace(0, 1, n), np.linspace(0, 1, n))
+    points = np.column_stack([x.ravel(), y.ravel(), np.sin(x * y).ravel()])
+    i = np.arange(n * n).reshape(n, n)[:-1, :-1].ravel() + 1
+    quads = np.column_stack([i, i + 1, i + n + 1, i + n])
+    with open(filename, "w") as f:
+        np.savetxt(f, points, fmt="v %.9g %.9g %.9g")
+        np.savetxt(f, points[:, :2], fmt="vt %.6f %.6f")
+        np.savetxt(f, np.tile([0.0, 0.0, 1.0], (n * n, 1)), fmt="vn %.1f %.1f %.1f")
+        np.savetxt(f, np.repeat(quads, 3, axis=1), fmt="f" + " %d/%d/%d" * 4)
+
+
+def measure(name, read, filename, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        mesh = read(filename)
+        times.append(time.perf_counter() - start)
+    size = os.path.getsize(filename) / 1e6
+    print("{:<16}{:8.3f} s{:10.1f} MB/s  ({} points)".format(name, min(times), size / min(times), len(mesh.points)))
+
+
+def read_lines(filename):
+    with open(filename, "r") as f:
+        return obj.read_buffer(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("file", nargs="?", help="obj file to read, a generated one if omitted")
+    parser.add_argument("--size", type=float, default=100, help="size of the generated file in MB")
+    parser.add_argument("--workers", type=int, default=obj.max_workers, help="processes of read_parallel")
+    parser.add_argument("--repeat", type=int, default=3, help="reads per reader, the fastest one is reported")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        filename = args.file
+        if filename is None:
+            filename = os.path.join(directory, "grid.obj")
+            write_obj(filename, args.size)
+        print("{}: {:.1f} MB".format(filename, os.path.getsize(filename) / 1e6))
+
+        measure("read_buffer", read_lines, filename, args.repeat)
+        measure("read", obj.read, filename, args.repeat)
+        obj.max_workers = args.workers
+        obj.min_parallel_size = 0
+        # the first call starts the worker processes, it isn't measured
+        obj.read_parallel(filename)
+        measure("read_parallel", obj.read_parallel, filename, args.repeat)
+        obj.shutdown()
+
+
+if __name__ == "__main__":
+    main()
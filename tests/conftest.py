@@ -0,0 +1,8 @@
+import os
+import sys
+
+# the addon adds these paths in __init__.py, which can't be imported without bpy
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in [root] + [os.path.join(root, "extern", lib) for lib in ("fileseq/src", "meshio/src")]:
+    if os.path.exists(path) and path not in sys.path:
+        sys.path.insert(0, path)
@@ -0,0 +1,205 @@
+"""
+Round trips of baked frames through Baker.write and read_frame of bseq/bake.py.
+"""
+import importlib.util
+import os
+
+import numpy as np
+import pytest
+
+# bseq/__init__.py imports bpy, bake.py itself only needs numpy
+spec = importlib.util.spec_from_file_location(
+    "bake", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "bseq", "bake.py"))
+bake = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(bake)
+
+
+def make_frames(n, n_points=200, seed=0):
+    """The arrays of n frames of a mesh of quads with fixed topology whose points move."""
+    rng = np.random.default_rng(seed)
+    co = rng.normal(size=(n_points, 3)).astype(np.float32)
+    loops = rng.integers(0, n_points, 4 * n_points // 2).astype(np.int32)
+    frames = []
+    for i in range(n):
+        co = co + rng.normal(scale=1e-2, size=co.shape).astype(np.float32)
+        frames.append({
+            "co": co,
+            "edges": np.zeros((0, 2), dtype=np.int32),
+            "loops": loops,
+            "loop_start": np.arange(0, len(loops), 4, dtype=np.int32),
+            "loop_total": np.full(len(loops) // 4, 4, dtype=np.int32),
+            "point:velocity": rng.normal(size=(n_points, 3)).astype(np.float32),
+            "point:id": np.arange(n_points, dtype=np.int64),
+        })
+    return frames
+
+
+def bake_frames(directory, frames, key_interval=0):
+    baker = bake.Baker(key_interval=key_interval)
+    paths = []
+    for i, arrays in enumerate(frames):
+        paths.append(os.path.join(str(directory), "frame_%04d" % i + bake.extension))
+        baker.write(paths[-1], arrays, {"frame": i})
+    return paths
+
+
+def assert_same_arrays(expected, arrays):
+    assert expected.keys() == arrays.keys()
+    for name, array in expected.items():
+        assert arrays[name].dtype == array.dtype, name
+        assert arrays[name].shape == array.shape, name
+        # bit exact, also for nan and -0.0
+        assert np.asarray(arrays[name]).tobytes() == np.ascontiguousarray(array).tobytes(), name
+
+
+def test_round_trip(tmp_path):
+    frames = make_frames(3)
+    paths = bake_frames(tmp_path, frames)
+    for i, (path, arrays) in enumerate(zip(paths, frames)):
+        meta, read = bake.read_frame(path)
+        assert meta == {"frame": i}
+        assert_same_arrays(arrays, read)
+
+
+def test_read_some_arrays(tmp_path):
+    frames = make_frames(2)
+    paths = bake_frames(tmp_path, frames)
+    _, arrays = bake.read_frame(paths[1], ["co", "loops"])
+    assert_same_arrays({k: frames[1][k] for k in ("co", "loops")}, arrays)
+
+
+def test_not_a_baked_frame(tmp_path):
+    path = tmp_path / "mesh.bseq"
+    path.write_bytes(b"v 1 2 3\n")
+    with pytest.raises(ValueError):
+        bake.read_frame(str(path))
+
+
+def test_shared_blocks(tmp_path):
+    frames = make_frames(3)
+    # the topology changes in the last frame
+    frames[2]["loops"] = frames[2]["loops"][::-1].copy()
+    paths = bake_frames(tmp_path, frames)
+    blocks = [bake.read_header(path)["blocks"] for path in paths]
+    first = os.path.basename(paths[0])
+    for name in ("edges", "loop_start", "loop_total", "point:id"):
+        assert "offset" in blocks[0][name]
+        assert blocks[1][name] == {"file": first}
+        assert blocks[2][name]["file"] == first
+    assert blocks[1]["loops"]["file"] == first
+    assert "offset" in blocks[2]["loops"]
+    for name in ("co", "point:velocity"):
+        assert all("offset" in b[name] for b in blocks)
+    assert os.path.getsize(paths[1]) < os.path.getsize(paths[0])
+    for path, arrays in zip(paths, frames):
+        assert_same_arrays(arrays, bake.read_frame(path)[1])
+
+
+def test_missing_array_is_not_shared(tmp_path):
+    frames = make_frames(3)
+    del frames[1]["point:velocity"]
+    frames[2]["point:velocity"] = frames[0]["point:velocity"]
+    paths = bake_frames(tmp_path, frames)
+    assert "offset" in bake.read_header(paths[2])["blocks"]["point:velocity"]
+    for path, arrays in zip(paths, frames):
+        assert_same_arrays(arrays, bake.read_frame(path)[1])
+
+
+def test_reused_buffers(tmp_path):
+    # the importer passes the same staging buffers for every frame
+    frames = make_frames(3)
+    buffers = {name: array.copy() for name, array in frames[0].items()}
+    baker = bake.Baker(key_interval=2)
+    paths = []
+    for i, arrays in enumerate(frames):
+        for name, array in arrays.items():
+            buffers[name][...] = array
+        paths.append(str(tmp_path / ("frame_%04d" % i + bake.extension)))
+        baker.write(paths[-1], buffers)
+    for path, arrays in zip(paths, frames):
+        assert_same_arrays(arrays, bake.read_frame(path)[1])
+
+
+def test_delta_chain(tmp_path):
+    frames = make_frames(11)
+    frames[5]["co"][0] = [np.nan, -0.0, np.inf]
+    key_interval = 4
+    paths = bake_frames(tmp_path, frames, key_interval)
+    key = None
+    for i, path in enumerate(paths):
+        block = bake.read_header(path)["blocks"]["co"]
+        if i % key_interval == 0:
+            assert "encoding" not in block
+            key = os.path.basename(path)
+        else:
+            assert block["encoding"] == "xor-zlib"
+            assert block["file"] == key
+        assert_same_arrays(frames[i], bake.read_frame(path)[1])
+
+
+def test_delta_chain_with_changing_number_of_points(tmp_path):
+    frames = make_frames(4)
+    # the positions of frame 2 can't be encoded against the key frame 0
+    frames[2]["co"] = np.concatenate([frames[2]["co"], frames[2]["co"][:5]])
+    paths = bake_frames(tmp_path, frames, key_interval=8)
+    blocks = [bake.read_header(path)["blocks"]["co"] for path in paths]
+    assert blocks[1]["encoding"] == "xor-zlib"
+    assert "encoding" not in blocks[2]
+    # frame 2 is the new key frame of frame 3, which has the old number of points again
+    assert "encoding" not in blocks[3]
+    for path, arrays in zip(paths, frames):
+        assert_same_arrays(arrays, bake.read_frame(path)[1])
+
+
+def test_delta_matches_bits():
+    rng = np.random.default_rng(1)
+    key = rng.normal(size=(1000, 3)).astype(np.float32)
+    array = key + rng.normal(scale=1e-3, size=key.shape).astype(np.float32)
+    array[:3] = [[np.nan, -0.0, np.inf], [-np.inf, 0.0, 1e-45], [np.finfo(np.float32).max, 1, -1]]
+    decoded = bake.decode_delta(bake.encode_delta(array, key), key)
+    assert decoded.tobytes() == array.tobytes()
+
+
+def test_quantized(tmp_path):
+    frames = make_frames(3)
+    frames[1]["point:velocity"][:, 2] = 0.5
+    frames[2]["point:velocity"][0, 0] = np.nan
+    exact = bake.Baker()
+    quantized = bake.Baker(quantized=True)
+    for i, arrays in enumerate(frames):
+        exact_path = str(tmp_path / ("frame_%04d" % i + bake.extension))
+        path = bake.get_bake_path(str(tmp_path), "frame_%04d" % i, quantized=True)
+        exact.write(exact_path, arrays)
+        quantized.write(path, arrays, {"frame": i}, exact_path)
+        blocks = bake.read_header(path)["blocks"]
+        meta, read = bake.read_frame(path)
+        assert meta == {"frame": i}
+        assert read.keys() == arrays.keys()
+        # the velocities of frame 2 aren't finite, they are stored exactly
+        assert {name for name, block in blocks.items() if block.get("encoding") == "quantized"} == \
+            ({"co", "point:velocity"} if i != 2 else {"co"})
+        for name, array in arrays.items():
+            block = blocks[name]
+            if block.get("encoding") != "quantized":
+                # shared with the exact frame
+                assert block["file"] == os.path.basename(exact_path)
+                assert_same_arrays({name: array}, {name: read[name]})
+                continue
+            bits = bake.position_bits if name == "co" else bake.attribute_bits
+            assert np.dtype(block["stored_dtype"]).itemsize * 8 == bits
+            assert read[name].dtype == np.float32 and read[name].shape == array.shape
+            # rounding to the nearest step, plus the float32 error of low + q * scale
+            low = array.min(axis=0)
+            scale = (array.max(axis=0) - low) / ((1 << bits) - 1)
+            bound = scale / 2 + 4 * np.finfo(np.float32).eps * np.abs(array).max(axis=0)
+            assert (np.abs(read[name] - array) <= bound).all(), name
+    # constant columns are exact
+    _, read = bake.read_frame(bake.get_bake_path(str(tmp_path), "frame_0001", quantized=True))
+    assert (read["point:velocity"][:, 2] == 0.5).all()
+
+
+def test_empty_arrays(tmp_path):
+    arrays = {"co": np.zeros((0, 3), dtype=np.float32), "edges": np.zeros((0, 2), dtype=np.int32)}
+    path = str(tmp_path / ("empty" + bake.extension))
+    bake.Baker(key_interval=4).write(path, arrays)
+    assert_same_arrays(arrays, bake.read_frame(path)[1])
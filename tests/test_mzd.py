@@ -0,0 +1,89 @@
+"""
+Checks decode_half of additional_file_formats.mzd against a decoder of the IEEE 754 binary16 format written
+in plain Python.
+"""
+import math
+import struct
+
+import numpy as np
+import pytest
+
+from additional_file_formats import mzd
+
+
+def hex_id(value):
+    return "0x%04x" % value if isinstance(value, int) else None
+
+
+def float32_bits(value):
+    return struct.unpack("<I", struct.pack("<f", value))[0]
+
+
+def reference_bits(half):
+    """The bits of the float32 value of the half float with the bits half, NaNs are quiet."""
+    sign = half >> 15
+    exponent = (half >> 10) & 0x1f
+    mantissa = half & 0x3ff
+    if exponent == 0x1f:
+        # inf, or NaN with the payload in the upper bits of the mantissa and the quiet bit set
+        return sign << 31 | 0x7f800000 | (0x00400000 if mantissa else 0) | mantissa << 13
+    if exponent == 0:
+        # zero and subnormals
+        value = math.ldexp(mantissa, -24)
+    else:
+        value = math.ldexp(0x400 | mantissa, exponent - 25)
+    return float32_bits(-value if sign else value)
+
+
+@pytest.fixture(scope="module")
+def reference():
+    return np.array([reference_bits(half) for half in range(1 << 16)], dtype=np.uint32)
+
+
+def test_all_bit_patterns(reference):
+    bits = np.arange(1 << 16, dtype=np.uint32).astype(np.uint16)
+    values = mzd.decode_half(bits)
+    assert values.dtype == np.float32
+    wrong = np.flatnonzero(values.view(np.uint32) != reference)
+    assert len(wrong) == 0, ["0x%04x" % w for w in wrong[:10]]
+
+
+@pytest.mark.parametrize("half, value", [
+    (0x0000, 0.0),
+    (0x3c00, 1.0),
+    (0xc000, -2.0),
+    (0x3555, 0.333251953125),
+    (0x7bff, 65504.0),
+    (0x0400, 2.0 ** -14),
+    (0x0001, 2.0 ** -24),
+    (0x03ff, 1023 * 2.0 ** -24),
+    (0x8001, -2.0 ** -24),
+    (0x7c00, math.inf),
+    (0xfc00, -math.inf),
+], ids=hex_id)
+def test_values(reference, half, value):
+    assert reference[half] == float32_bits(value)
+    assert mzd.decode_half(np.array([half], dtype=np.uint16))[0] == value
+
+
+def test_signed_zeros():
+    values = mzd.decode_half(np.array([0x0000, 0x8000], dtype=np.uint16))
+    assert values.view(np.uint32).tolist() == [0x00000000, 0x80000000]
+
+
+@pytest.mark.parametrize("half", [0x7c01, 0x7d00, 0x7dff, 0x7e00, 0x7fff, 0xfc01, 0xfe00], ids=hex_id)
+def test_nan(half):
+    bits = int(mzd.decode_half(np.array([half], dtype=np.uint16)).view(np.uint32)[0])
+    assert bits & 0x7f800000 == 0x7f800000
+    # quiet, with the sign and the payload of the half float
+    assert bits & 0x00400000
+    assert bits >> 31 == half >> 15
+    assert (bits >> 13) & 0x1ff == half & 0x1ff
+
+
+def test_shape():
+    rng = np.random.default_rng(0)
+    normals = rng.normal(size=(100, 3)).astype(np.float16)
+    values = mzd.decode_half(normals.view(np.uint16))
+    assert values.shape == (100, 3)
+    assert np.array_equal(values, normals.astype(np.float32))
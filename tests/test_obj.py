@@ -0,0 +1,205 @@
+"""
+Checks that the bulk parser (read_bytes) and the parallel reader (read_parallel) of additional_file_formats.obj
+return the same meshes as the line parser (read_buffer).
+"""
+import io
+import os
+import signal
+import time
+
+import numpy as np
+import pytest
+
+from additional_file_formats import obj
+
+
+def make_obj(rng, n_points=50, n_faces=80, form="v", sizes=(3,), groups=0, n_uvs=0, n_normals=0, crlf=False,
+             comments=False, extra=False):
+    """Returns the text of a random obj file, form is one of v, vt, vn and vtn."""
+    def numbers(values):
+        return " ".join(repr(float(x)) if rng.random() < 0.5 else "%.6g" % x for x in values)
+
+    lines = []
+    if comments:
+        lines += ["# header", "mtllib a.mtl", "o thing"]
+    lines += ["v " + numbers(p) for p in rng.normal(size=(n_points, 3)) * rng.choice([1e-8, 1, 1e6])]
+    lines += ["vt " + numbers(t) for t in rng.random((n_uvs, 2))]
+    lines += ["vn " + numbers(n) for n in rng.normal(size=(n_normals, 3))]
+    if extra:
+        lines += ["s off", ""]
+    for i in range(n_faces):
+        if groups and i % max(1, n_faces // groups) == 0:
+            lines.append("g group%d" % i)
+        if extra and i == 3:
+            lines += ["g", "usemtl m"]
+        vertices = rng.integers(1, n_points + 1, int(rng.choice(sizes)))
+        if form == "v":
+            tokens = ["%d" % v for v in vertices]
+        elif form == "vt":
+            tokens = ["%d/%d" % (v, rng.integers(1, n_uvs + 1)) for v in vertices]
+        elif form == "vn":
+            tokens = ["%d//%d" % (v, rng.integers(1, n_normals + 1)) for v in vertices]
+        else:
+            tokens = ["%d/%d/%d" % (v, rng.integers(1, n_uvs + 1), rng.integers(1, n_normals + 1)) for v in vertices]
+        lines.append(("f\t" if extra and i % 7 == 0 else "f ") + " ".join(tokens))
+    return ("\r\n" if crlf else "\n").join(lines) + ("\n" if rng.random() < 0.5 else "")
+
+
+def random_obj(rng):
+    form = str(rng.choice(["v", "vt", "vn", "vtn"]))
+    return make_obj(rng,
+                    n_points=int(rng.integers(1, 40)),
+                    n_faces=int(rng.integers(0, 60)),
+                    form=form,
+                    sizes=tuple(rng.choice([3, 4, 5, 6], size=int(rng.integers(1, 4)))),
+                    groups=int(rng.integers(0, 5)),
+                    n_uvs=int(rng.integers(1, 30)) if "t" in form else int(rng.integers(0, 3)),
+                    n_normals=int(rng.integers(1, 30)) if "n" in form else 0,
+                    crlf=bool(rng.random() < 0.3),
+                    comments=bool(rng.random() < 0.5),
+                    extra=bool(rng.random() < 0.5))
+
+
+def regular_files():
+    rng = np.random.default_rng(5)
+    files = {
+        "triangles": make_obj(rng),
+        "uvs": make_obj(rng, form="vt", n_uvs=60, sizes=(3, 4)),
+        "normals": make_obj(rng, form="vn", n_normals=50, sizes=(3, 4, 5)),
+        "uvs and normals": make_obj(rng, form="vtn", n_uvs=40, n_normals=50, groups=5, sizes=(4,)),
+        "crlf": make_obj(rng, form="vtn", n_uvs=50, n_normals=50, sizes=(3, 4), crlf=True, comments=True,
+                         extra=True),
+        "no faces": make_obj(rng, n_faces=0),
+        "a group per face": make_obj(rng, groups=80),
+        "empty groups": "v 1 2 3\nv 4 5 6\nv 7 8 9\nf 1 2 3\ng\ng\nf 1 2 3\nf 3 2 1\nf 1 2 3 1\n",
+        "no final newline": "v 1 2 3\nf 1 1 1",
+        "one index per kind": "v 1 2 3\nvn 0 0 1\nvt 0.5 0.5\nf 1/1/1 1/1/1 1/1/1\n",
+    }
+    files.update(("random %d" % i, random_obj(rng)) for i in range(40))
+    return files
+
+
+# files that read_bytes can't read, read falls back to read_buffer for them
+irregular_files = {
+    "indented line": "v 1 2 3\n v 1 2 3\nf 1 2 3\n",
+    "mixed index forms": "v 1 2 3\nvt 0 0\nf 1/1 1/1 1//1\n",
+    "mixed index forms with normals": "v 1 2 3\nvt 1 1\nvn 1 1 1\nf 1/1/1 1//1 1/1/1\n",
+    "face without indices": "v 1 2 3\nv 4 5 6\nv 7 8 9\nf\nf 1 2 3\n",
+    "last face without indices": "v 1 2 3\nv 4 5 6\nv 7 8 9\nf 1 2 3\nf\n",
+}
+
+# files that read_buffer can't read either, all readers have to raise its error
+invalid_files = {
+    "point with weight": "v 1 2 3\nv 1 2 3 1\nf 1 2 2\n",
+    "comment after face": "v 1 2 3\nf 1 2 3 # c\n",
+    "comment after point": "v 1 2 3 # p\nf 1 1 1\n",
+}
+
+
+def assert_same(a, b, path="mesh"):
+    if isinstance(a, dict):
+        assert a.keys() == b.keys(), path
+        for k in a:
+            assert_same(a[k], b[k], path + "/" + k)
+    elif isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
+        assert len(a) == len(b), path
+        for i, (x, y) in enumerate(zip(a, b)):
+            assert_same(x, y, "%s[%d]" % (path, i))
+    else:
+        a = np.asarray(a)
+        b = np.asarray(b)
+        assert a.dtype == b.dtype, (path, a.dtype, b.dtype)
+        assert a.shape == b.shape, (path, a.shape, b.shape)
+        assert np.array_equal(a, b), path
+
+
+def assert_same_mesh(expected, mesh):
+    assert_same(expected.points, mesh.points, "points")
+    assert [c.type for c in expected.cells] == [c.type for c in mesh.cells]
+    assert_same([c.data for c in expected.cells], [c.data for c in mesh.cells], "cells")
+    assert_same(expected.point_data, mesh.point_data, "point_data")
+    assert_same(expected.cell_data, mesh.cell_data, "cell_data")
+    assert_same(expected.field_data, mesh.field_data, "field_data")
+
+
+def write(tmp_path, text):
+    filename = str(tmp_path / "mesh.obj")
+    with open(filename, "w", newline="") as f:
+        f.write(text)
+    return filename
+
+
+@pytest.fixture(scope="module")
+def parallel():
+    """Makes read_parallel split even small files among 3 workers."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(obj, "min_parallel_size", 0)
+        mp.setattr(obj, "max_workers", 3)
+        yield
+        obj.shutdown()
+
+
+def cases(files):
+    return [pytest.param(text, id=name) for name, text in files.items()]
+
+
+@pytest.mark.parametrize("text", cases(regular_files()))
+def test_read_bytes(text):
+    assert_same_mesh(obj.read_buffer(io.StringIO(text)), obj.read_bytes(bytearray(text.encode())))
+
+
+@pytest.mark.parametrize("text", cases(regular_files()))
+def test_small_chunks(monkeypatch, text):
+    # several chunks per file, which split lines and numbers
+    monkeypatch.setattr(obj, "chunk_size", 7)
+    assert_same_mesh(obj.read_buffer(io.StringIO(text)), obj.read_bytes(bytearray(text.encode())))
+
+
+@pytest.mark.parametrize("text", cases(irregular_files))
+def test_irregular_layout(tmp_path, text):
+    with pytest.raises(obj.LayoutError):
+        obj.read_bytes(bytearray(text.encode()))
+    assert_same_mesh(obj.read_buffer(io.StringIO(text)), obj.read(write(tmp_path, text)))
+
+
+@pytest.mark.parametrize("text", cases(invalid_files))
+def test_invalid_file(tmp_path, text):
+    with pytest.raises(obj.LayoutError):
+        obj.read_bytes(bytearray(text.encode()))
+    with pytest.raises(ValueError):
+        obj.read_buffer(io.StringIO(text))
+    with pytest.raises(ValueError):
+        obj.read(write(tmp_path, text))
+
+
+def test_empty_file(tmp_path):
+    with pytest.raises(obj.LayoutError):
+        obj.read_bytes(bytearray())
+    assert_same_mesh(obj.read_buffer(io.StringIO("")), obj.read(write(tmp_path, "")))
+
+
+@pytest.mark.parametrize("text", cases(regular_files()) + cases(irregular_files))
+def test_read_parallel(parallel, tmp_path, text):
+    assert_same_mesh(obj.read_buffer(io.StringIO(text)), obj.read_parallel(write(tmp_path, text)))
+
+
+@pytest.mark.parametrize("text", cases(invalid_files))
+def test_read_parallel_invalid_file(parallel, tmp_path, text):
+    with pytest.raises(ValueError):
+        obj.read_parallel(write(tmp_path, text))
+
+
+def test_broken_pool(parallel, tmp_path):
+    filename = write(tmp_path, regular_files()["uvs and normals"])
+    expected = obj.read(filename)
+    obj.read_parallel(filename)
+    executor = obj.get_executor()
+    for process in list(executor._processes.values()):
+        os.kill(process.pid, signal.SIGKILL)
+    for process in list(executor._processes.values()):
+        process.join(10)
+    time.sleep(0.1)
+    # the read with the broken pool falls back to read, the next one starts a new pool
+    assert_same_mesh(expected, obj.read_parallel(filename))
+    assert obj.get_executor() is not executor
+    assert_same_mesh(expected, obj.read_parallel(filename))